@@ -0,0 +1,50 @@
+"""
+Runtime choice between the pure Python and NumPy implementations of a day.
+
+The AOC_BACKEND environment variable selects the implementation:
+"python" (default), "numpy", or "check", which runs both and fails if their
+answers differ. NumPy is optional; only the last two need it, and it is imported by the
+NumPy implementations themselves, so the default backend never loads it.
+"""
+
+import os
+from collections.abc import Callable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+BACKENDS = ("python", "numpy", "check")
+DEFAULT_BACKEND = "python"
+ENV_VAR = "AOC_BACKEND"
+
+
+def selected() -> str:
+    backend = os.environ.get(ENV_VAR, DEFAULT_BACKEND)
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown value {ENV_VAR}={backend!r}, expected one of {', '.join(BACKENDS)}")
+    if backend != "python":
+        try:
+            import numpy  # noqa: F401
+        except ImportError:  # Not installed, e.g. on PyPy
+            raise RuntimeError(f"{ENV_VAR}={backend} needs NumPy") from None
+    return backend
+
+
+def run(python: Callable[..., T], vectorized: Callable[..., T], *args) -> T:
+    """
+    Call the implementation of the selected backend with args.
+
+    In check mode both are called with the same args, so neither may
+    consume them.
+    """
+    match selected():
+        case "python":
+            return python(*args)
+        case "numpy":
+            return vectorized(*args)
+        case _:
+            expected = python(*args)
+            answer = vectorized(*args)
+            if answer != expected:
+                raise AssertionError(f"NumPy backend answered {answer}, Python backend {expected}")
+            return expected
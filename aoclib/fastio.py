@@ -0,0 +1,67 @@
+"""
+Fast input parsing.
+
+read_input() returns stdin as bytes, or as a read-only mmap when stdin is a
+regular file, so the input is never decoded or copied as a whole. The other
+helpers work on such a buffer directly: records are memoryview slices and
+integers are matched by a bytes regex.
+"""
+
+import mmap
+import operator
+import os
+import re
+import stat
+import sys
+from collections.abc import Iterator
+
+Buffer = bytes | bytearray | mmap.mmap
+
+UNSIGNED_INT = re.compile(rb"\d+")
+SIGNED_INT = re.compile(rb"-?\d+")
+
+
+def read_input() -> Buffer:
+    try:
+        fd = sys.stdin.fileno()
+    except (AttributeError, OSError, ValueError):
+        # Replaced by an in-memory stream
+        return sys.stdin.buffer.read()
+
+    info = os.fstat(fd)
+    if stat.S_ISREG(info.st_mode) and info.st_size > 0:
+        return mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    return sys.stdin.buffer.read()
+
+
+def text(data: Buffer) -> str:
+    return str(data, "utf-8")
+
+
+def ints(data: Buffer | memoryview, signed: bool = False) -> list[int]:
+    """All integers in data. A dash is a separator unless `signed` is set."""
+    pattern = SIGNED_INT if signed else UNSIGNED_INT
+    return list(map(int, pattern.findall(data)))
+
+
+def iter_ints(data: Buffer | memoryview, signed: bool = False) -> Iterator[int]:
+    """Like ints(), but lazily, without holding all matches at once."""
+    pattern = SIGNED_INT if signed else UNSIGNED_INT
+    return map(int, map(operator.itemgetter(0), pattern.finditer(data)))
+
+
+def records(data: Buffer, sep: bytes = b"\n") -> Iterator[memoryview]:
+    """
+    Yield the records between separators as memoryview slices of data.
+
+    A separator at the very end does not start an empty record.
+    """
+    view = memoryview(data)
+    start = 0
+    while start < len(view):
+        stop = data.find(sep, start)
+        if stop < 0:
+            stop = len(view)
+        yield view[start:stop]
+        start = stop + len(sep)
+
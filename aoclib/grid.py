@@ -0,0 +1,81 @@
+"""
+Flat grid with a sentinel border.
+
+Cells are bytes in one bytearray, row by row, with a one-cell border around
+the grid. Every inner cell therefore has all 8 neighbours at valid indices,
+and neighbour lookups need no bounds checks: index + offset for each offset
+in offsets4 or offsets8.
+"""
+
+from aoclib import fastio
+
+# Value of the border cells
+SENTINEL = 0xFF
+
+
+class Grid:
+    __slots__ = ("rows", "cols", "stride", "cells", "offsets4", "offsets8")
+
+    def __init__(self, rows: int, cols: int, fill: int = 0) -> None:
+        self.rows = rows
+        self.cols = cols
+        self.stride = stride = cols + 2
+
+        self.cells = bytearray([SENTINEL]) * (stride * (rows + 2))
+        for r in range(rows):
+            start = self.index(r, 0)
+            self.cells[start:start + cols] = bytes([fill]) * cols
+
+        self.offsets4 = (-stride, -1, 1, stride)
+        self.offsets8 = (-stride - 1, -stride, -stride + 1, -1, 1, stride - 1, stride, stride + 1)
+
+    @classmethod
+    def from_text(cls, data: fastio.Buffer, table: bytes) -> "Grid":
+        """
+        Build a grid from equally long lines of text, mapping characters
+        through table (see bytes.maketrans).
+
+        Each line is translated straight into the grid, so the input is never
+        copied as a whole.
+        """
+        cols = data.find(b"\n")
+        if cols < 0:
+            cols = len(data)
+        line_stride = cols + 1
+        rows = (len(data) + 1) // line_stride
+
+        grid = cls(rows, cols)
+        cells = grid.cells
+        for r in range(rows):
+            start = grid.index(r, 0)
+            line = r * line_stride
+            cells[start:start + cols] = data[line:line + cols].translate(table)
+        return grid
+
+    def index(self, r: int, c: int) -> int:
+        return (r + 1) * self.stride + c + 1
+
+    def flood_fill(self, start: int, value: int, offsets: tuple[int, ...] | None = None) -> int:
+        """
+        Set the cells connected to start that hold the same value as start.
+
+        Uses the 4-neighbourhood by default. Returns the number of cells set.
+        """
+        cells = self.cells
+        target = cells[start]
+        if target == value:
+            return 0
+        offsets = offsets or self.offsets4
+
+        cells[start] = value
+        count = 1
+        to_visit = [start]
+        while to_visit:
+            i = to_visit.pop()
+            for offset in offsets:
+                j = i + offset
+                if cells[j] == target:
+                    cells[j] = value
+                    count += 1
+                    to_visit.append(j)
+        return count
@@ -0,0 +1 @@
+"""Benchmark helpers for measure.py."""
@@ -0,0 +1,60 @@
+"""
+Content-addressed cache of measurement results.
+
+A result is stored under the hash of everything that can change it: the
+day's program.py and in.txt, the shared aoclib sources it imports (and
+bench/worker.py for modes that time phases in it), the interpreter identity
+(name, command and version), the measurement mode and the sampling plan.
+Unchanged combinations are not measured again.
+"""
+
+import hashlib
+import json
+import pathlib
+
+CACHE_DIR = pathlib.Path(".bench") / "cache"
+
+# Bump when the format or meaning of cached results changes
+CACHE_VERSION = "2"
+
+# Modes whose phases are timed by importing the program into bench.worker
+WORKER_MODE_PREFIXES = ("in-process", "scale")
+
+
+def program_sources(day_path: pathlib.Path, mode: str) -> list[pathlib.Path]:
+    """The day's program.py and the repository code it runs with in the given mode."""
+    root = day_path.parents[1]
+    paths = [day_path / "program.py", *sorted((root / "aoclib").glob("*.py"))]
+    if mode.startswith(WORKER_MODE_PREFIXES):
+        paths.append(root / "bench" / "worker.py")
+    return paths
+
+
+def cache_key(day_path: pathlib.Path, mode: str, interpreter: tuple, settings: tuple) -> str:
+    h = hashlib.sha256()
+    for part in (CACHE_VERSION, mode, repr(interpreter), repr(settings)):
+        h.update(part.encode())
+        h.update(b"\0")
+    for path in program_sources(day_path, mode):
+        h.update(path.read_bytes())
+        h.update(b"\0")
+    h.update((day_path / "in.txt").read_bytes())
+    return h.hexdigest()
+
+
+def load(root: pathlib.Path, key: str) -> dict | None:
+    path = root / CACHE_DIR / f"{key}.json"
+    try:
+        with path.open() as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def store(root: pathlib.Path, key: str, value: dict) -> None:
+    path = root / CACHE_DIR / f"{key}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with tmp_path.open("w") as f:
+        json.dump(value, f)
+    tmp_path.replace(path)
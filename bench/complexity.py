@@ -0,0 +1,70 @@
+"""
+Empirical complexity of measurements against input size.
+
+fit() fits y ~ n^k on a log-log scale for the exponent k, and compares the
+candidate models in MODELS by least squares, each with a constant term.
+"""
+
+import math
+from collections.abc import Callable
+from typing import NamedTuple
+
+MODELS: dict[str, Callable[[float], float]] = {
+    "n": lambda n: n,
+    "n log n": lambda n: n * math.log(n),
+    "n^2": lambda n: n**2,
+    "n^3": lambda n: n**3,
+}
+
+# Fewer sizes than this say nothing about the shape of the curve
+MIN_POINTS = 3
+
+
+class Fit(NamedTuple):
+    exponent: float
+    r2: float
+    model: str
+    model_r2: float
+
+
+def linear_fit(xs: list[float], ys: list[float]) -> tuple[float, float, float]:
+    """Least squares line through the points. Returns (intercept, slope, R²)."""
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    syy = sum((y - mean_y) ** 2 for y in ys)
+
+    slope = sxy / sxx if sxx else 0.0
+    intercept = mean_y - slope * mean_x
+    if syy == 0:
+        return intercept, slope, 1.0
+
+    residual = sum((y - intercept - slope * x) ** 2 for x, y in zip(xs, ys))
+    return intercept, slope, 1 - residual / syy
+
+
+def fit(ns: list[int], ys: list[float | None]) -> Fit | None:
+    """
+    Fit measurements ys taken at sizes ns.
+
+    Missing, zero and NaN values are skipped. Returns None if fewer than
+    MIN_POINTS remain.
+    """
+    points = [(n, y) for n, y in zip(ns, ys) if n > 1 and y is not None and y > 0 and not math.isnan(y)]
+    if len(points) < MIN_POINTS:
+        return None
+    sizes = [n for n, _ in points]
+    values = [y for _, y in points]
+
+    _, exponent, r2 = linear_fit([math.log(n) for n in sizes], [math.log(y) for y in values])
+
+    # A constant explains none of the variance, unless there is none.
+    # Other models are only candidates if they grow with n.
+    best, best_r2 = "1", 1.0 if len(set(values)) == 1 else 0.0
+    for name, model in MODELS.items():
+        _, slope, model_r2 = linear_fit([model(n) for n in sizes], values)
+        if slope > 0 and model_r2 > best_r2:
+            best, best_r2 = name, model_r2
+
+    return Fit(exponent, r2, best, best_r2)
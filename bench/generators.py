@@ -0,0 +1,230 @@
+"""
+Seeded input generators for scaling benchmarks.
+
+Every generator takes a random.Random and a size n and returns a valid
+puzzle input. What n counts depends on the day, see GENERATORS.
+
+Usage: python -m bench.generators <day> <n> [--seed S] > in.txt
+"""
+
+import argparse
+import itertools
+import math
+import random
+import string
+import sys
+from collections.abc import Callable
+from typing import NamedTuple
+
+
+class Scale(NamedTuple):
+    generate: Callable[[random.Random, int], str]
+    unit: str
+    ladder: tuple[int, ...]
+
+
+def day01(rng: random.Random, n: int) -> str:
+    return "".join(f"{rng.choice('LR')}{rng.randint(1, 999)}\n" for _ in range(n))
+
+
+def day02(rng: random.Random, n: int) -> str:
+    ranges: list[str] = []
+    for _ in range(n):
+        start = rng.randint(1, 10 ** rng.randint(1, 10))
+        end = start + rng.randint(0, 10 ** rng.randint(1, 6))
+        ranges.append(f"{start}-{end}")
+    return ",".join(ranges) + "\n"
+
+
+def day03(rng: random.Random, n: int) -> str:
+    # n is the length of each of 100 banks
+    return "".join("".join(rng.choices("123456789", k=n)) + "\n" for _ in range(100))
+
+
+def day04(rng: random.Random, n: int) -> str:
+    return "".join("".join(rng.choices("@@@.", k=n)) + "\n" for _ in range(n))
+
+
+def day05(rng: random.Random, n: int) -> str:
+    intervals: list[tuple[int, int]] = []
+    for _ in range(n):
+        start = rng.randint(1, 10**14)
+        intervals.append((start, start + rng.randint(0, 10**12)))
+
+    ingredients: list[int] = []
+    for _ in range(n):
+        if rng.random() < 0.5:
+            start, end = rng.choice(intervals)
+            ingredients.append(rng.randint(start, end))
+        else:
+            ingredients.append(rng.randint(1, 10**14))
+
+    return (
+        "".join(f"{start}-{end}\n" for start, end in intervals)
+        + "\n"
+        + "".join(f"{ingredient}\n" for ingredient in ingredients)
+    )
+
+
+def day06(rng: random.Random, n: int) -> str:
+    # Numbers of a problem share a width, so its columns have no gaps
+    rows: list[list[str]] = [[] for _ in range(4)]
+    operators: list[str] = []
+
+    for _ in range(n):
+        width = rng.randint(1, 4)
+        for row in rows:
+            row.append(str(rng.randint(10 ** (width - 1), 10**width - 1)))
+        operators.append(rng.choice("+*").ljust(width))
+
+    return "".join(" ".join(row) + "\n" for row in rows + [operators])
+
+
+def day07(rng: random.Random, n: int) -> str:
+    # Splitters stay off the edges so beams never leave the grid
+    lines = ["." * (n // 2) + "S" + "." * (n - n // 2 - 1), "." * n]
+    for _ in range(n // 2 - 1):
+        lines.append("." + "".join("^" if rng.random() < 0.3 else "." for _ in range(n - 2)) + ".")
+        lines.append("." * n)
+    return "".join(line + "\n" for line in lines)
+
+
+def day08(rng: random.Random, n: int) -> str:
+    return "".join(f"{rng.randint(0, 10**5)},{rng.randint(0, 10**5)},{rng.randint(0, 10**5)}\n" for _ in range(n))
+
+
+def day09(rng: random.Random, n: int) -> str:
+    # A histogram: a rectilinear polygon with n vertices in order
+    columns = max(1, n // 2 - 1)
+    xs = sorted(rng.sample(range(1, 10**5), columns + 1))
+
+    heights: list[int] = []
+    for _ in range(columns):
+        height = rng.randint(1, 10**5)
+        while heights and height == heights[-1]:
+            height = rng.randint(1, 10**5)
+        heights.append(height)
+
+    points = [(xs[0], 0)]
+    for i, height in enumerate(heights):
+        points.append((xs[i], height))
+        points.append((xs[i + 1], height))
+    points.append((xs[-1], 0))
+
+    return "".join(f"{x},{y}\n" for x, y in points)
+
+
+def day10(rng: random.Random, n: int) -> str:
+    # Lights and joltages come from actual presses, so every machine is solvable
+    lines: list[str] = []
+
+    for _ in range(n):
+        num_lights = rng.randint(4, 10)
+        buttons = [
+            sorted(rng.sample(range(num_lights), rng.randint(1, num_lights - 1)))
+            for _ in range(rng.randint(num_lights // 2 + 1, num_lights + 3))
+        ]
+
+        state = [0] * num_lights
+        joltages = [0] * num_lights
+        for button in buttons:
+            toggled = rng.random() < 0.5
+            presses = rng.randint(0, 20)
+            for light in button:
+                state[light] ^= toggled
+                joltages[light] += presses
+
+        diagram = "".join("#" if light else "." for light in state)
+        wiring = " ".join("(" + ",".join(map(str, button)) + ")" for button in buttons)
+        lines.append(f"[{diagram}] {wiring} {{{','.join(map(str, joltages))}}}")
+
+    return "".join(line + "\n" for line in lines)
+
+
+def day11(rng: random.Random, n: int) -> str:
+    # A DAG in topological order: every node links to the next one, so paths
+    # run the whole length, plus an occasional shortcut
+    special = ["svr", "you", "fft", "dac", "out"]
+    names = (
+        "".join(letters)
+        for length in itertools.count(3)
+        for letters in itertools.product(string.ascii_lowercase, repeat=length)
+    )
+    nodes = list(itertools.islice((name for name in names if name not in special), max(0, n - len(special))))
+    for name, position in zip(special[:-1], (0, 0.1, 0.3, 0.6)):
+        nodes.insert(round(position * len(nodes)), name)
+    nodes.append("out")
+
+    lines: list[str] = []
+    for i, node in enumerate(nodes[:-1]):
+        successors = [nodes[i + 1]]
+        if rng.random() < 0.1 and i + 2 < len(nodes):
+            successors.append(nodes[rng.randint(i + 2, min(len(nodes) - 1, i + 20))])
+        lines.append(f"{node}: {' '.join(successors)}")
+
+    return "".join(line + "\n" for line in lines)
+
+
+def day12(rng: random.Random, n: int) -> str:
+    # Every region either lacks the area for its shapes or fits them as 3x3 blocks
+    shapes: list[list[str]] = []
+    for _ in range(6):
+        cells = ["#"] + rng.choices("#.", k=8)
+        rng.shuffle(cells)
+        shapes.append(["".join(cells[i:i + 3]) for i in range(0, 9, 3)])
+
+    lines: list[str] = []
+    for index, shape in enumerate(shapes):
+        lines += [f"{index}:", *shape, ""]
+
+    units = [sum(row.count("#") for row in shape) for shape in shapes]
+    for _ in range(n):
+        counts = [rng.randint(0, 50) for _ in shapes]
+        total_units = sum(unit * count for unit, count in zip(units, counts))
+
+        if total_units > 1 and rng.random() < 0.5:
+            width = rng.randint(1, math.isqrt(total_units - 1))
+            height = (total_units - 1) // width
+        else:
+            width = rng.randint(3, 3 * math.isqrt(sum(counts)) + 3)
+            height = max(3, -(-9 * sum(counts) // width))
+        lines.append(f"{width}x{height}: {' '.join(map(str, counts))}")
+
+    return "".join(line + "\n" for line in lines)
+
+
+GENERATORS: dict[int, Scale] = {
+    1: Scale(day01, "rotations", (10**3, 10**4, 10**5, 10**6)),
+    2: Scale(day02, "ranges", (10, 100, 1000, 10**4)),
+    3: Scale(day03, "bank length", (100, 200, 400, 800, 1600)),
+    4: Scale(day04, "grid side", (50, 100, 200, 400, 800)),
+    5: Scale(day05, "intervals", (100, 300, 1000, 3000, 10**4)),
+    6: Scale(day06, "problems", (10**3, 10**4, 10**5)),
+    7: Scale(day07, "grid side", (100, 200, 400, 800, 1600)),
+    8: Scale(day08, "junctions", (100, 300, 1000, 3000)),
+    9: Scale(day09, "vertices", (100, 300, 1000, 3000, 10**4)),
+    10: Scale(day10, "machines", (10, 100, 1000)),
+    11: Scale(day11, "nodes", (10**3, 10**4, 10**5)),
+    12: Scale(day12, "regions", (10**3, 10**4, 10**5)),
+}
+
+
+def generate(day: int, n: int, seed: int = 0) -> str:
+    """Generate the same input for the same day, size and seed on every run."""
+    rng = random.Random(f"{seed}:{day}:{n}")
+    return GENERATORS[day].generate(rng, n)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Print a generated input for a day.")
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS))
+    parser.add_argument("n", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    sys.stdout.write(generate(args.day, args.n, args.seed))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
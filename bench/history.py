@@ -0,0 +1,239 @@
+"""
+Persistent benchmark history.
+
+Every measurement is appended as one JSON line to .bench/history.jsonl,
+keyed by git commit, program/input hashes and interpreter version (the
+program hash covers the shared code it runs with), so that
+runs from different commits can be compared later. Complexity fits from
+scaling runs are stored the same way, one record per day and interpreter.
+"""
+
+import hashlib
+import json
+import math
+import pathlib
+import subprocess
+import time
+
+from bench.cache import program_sources
+
+HISTORY_PATH = pathlib.Path(".bench") / "history.jsonl"
+
+# A day is flagged when it is this much slower/larger than the baseline...
+TIME_THRESHOLD = 0.10
+MEMORY_THRESHOLD = 0.10
+# ...and the time difference exceeds this many combined standard deviations
+NOISE_SIGMAS = 3.0
+
+# A fitted exponent is flagged when it moves by more than this, with both
+# fits at least this good
+EXPONENT_THRESHOLD = 0.5
+MIN_FIT_R2 = 0.9
+
+# Records of fitted exponents instead of timings
+SCALE_MODE = "scale"
+
+
+def file_hash(path: pathlib.Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+
+
+def program_hash(day_path: pathlib.Path, mode: str) -> str:
+    """Hash of program.py and the shared code it runs with, see bench.cache.program_sources."""
+    h = hashlib.sha256()
+    for path in program_sources(day_path, mode):
+        h.update(path.read_bytes())
+        h.update(b"\0")
+    return h.hexdigest()[:16]
+
+
+def git_commit(root: pathlib.Path, ref: str = "HEAD") -> str:
+    out = subprocess.run(
+        ["git", "rev-parse", "--verify", f"{ref}^{{commit}}"],
+        cwd=root,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return out.stdout.strip()
+
+
+def git_dirty(root: pathlib.Path) -> bool:
+    out = subprocess.run(
+        ["git", "status", "--porcelain", "--untracked-files=no"],
+        cwd=root,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return bool(out.stdout.strip())
+
+
+def make_record(
+    root: pathlib.Path,
+    mode: str,
+    day: int,
+    interpreter: str,
+    interpreter_version: str,
+    time_stats: dict[str, float],
+    memory_kb: float | None,
+) -> dict:
+    """Build one history record. time_stats comes from bench.stats.summarize, in seconds."""
+    day_path = root / "day" / f"{day:02d}"
+    return {
+        "timestamp": time.time(),
+        "commit": git_commit(root),
+        "dirty": git_dirty(root),
+        "mode": mode,
+        "day": day,
+        "interpreter": interpreter,
+        "interpreter_version": interpreter_version,
+        "program_hash": program_hash(day_path, mode),
+        "input_hash": file_hash(day_path / "in.txt"),
+        "time": time_stats,
+        "memory_kb": memory_kb,
+    }
+
+
+def make_fit_record(
+    root: pathlib.Path,
+    day: int,
+    interpreter: str,
+    interpreter_version: str,
+    seed: int,
+    fits: dict[str, dict],
+) -> dict:
+    """Build one history record of complexity fits, keyed by measured column."""
+    day_path = root / "day" / f"{day:02d}"
+    return {
+        "timestamp": time.time(),
+        "commit": git_commit(root),
+        "dirty": git_dirty(root),
+        "mode": SCALE_MODE,
+        "day": day,
+        "interpreter": interpreter,
+        "interpreter_version": interpreter_version,
+        "program_hash": program_hash(day_path, SCALE_MODE),
+        "seed": seed,
+        "fits": fits,
+    }
+
+
+def append_records(root: pathlib.Path, records: list[dict]) -> None:
+    path = root / HISTORY_PATH
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+
+def load_records(root: pathlib.Path) -> list[dict]:
+    path = root / HISTORY_PATH
+    if not path.exists():
+        return []
+    with path.open() as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def latest_by_key(records: list[dict]) -> dict[tuple[str, int, str], dict]:
+    """Keep the most recent record per (mode, day, interpreter)."""
+    latest: dict[tuple[str, int, str], dict] = {}
+    for record in sorted(records, key=lambda r: r["timestamp"]):
+        latest[(record["mode"], record["day"], record["interpreter"])] = record
+    return latest
+
+
+def is_time_regression(old: dict[str, float], new: dict[str, float]) -> bool:
+    """Slower by more than TIME_THRESHOLD and by more than the combined noise."""
+    difference = new["median"] - old["median"]
+    noise = NOISE_SIGMAS * math.hypot(old["stddev"], new["stddev"])
+    return difference > TIME_THRESHOLD * old["median"] and difference > noise
+
+
+def is_memory_regression(old_kb: float | None, new_kb: float | None) -> bool:
+    if old_kb is None or new_kb is None:
+        return False
+    return new_kb > (1 + MEMORY_THRESHOLD) * old_kb
+
+
+def compare(root: pathlib.Path, ref: str) -> list[dict]:
+    """
+    Compare the latest measurements against the latest ones taken at ref.
+
+    Returns one row per (mode, day, interpreter) present in both, with
+    time/memory ratios and regression flags.
+    """
+    records = [r for r in load_records(root) if r["mode"] != SCALE_MODE]
+    baseline_commit = git_commit(root, ref)
+
+    baseline = latest_by_key([r for r in records if r["commit"] == baseline_commit])
+    current = latest_by_key(records)
+
+    rows: list[dict] = []
+    for key, new in sorted(current.items()):
+        old = baseline.get(key)
+        if old is None or old is new:
+            continue
+
+        mode, day, interpreter = key
+        rows.append({
+            "mode": mode,
+            "day": day,
+            "interpreter": interpreter,
+            "old_time": old["time"]["median"],
+            "new_time": new["time"]["median"],
+            "time_ratio": new["time"]["median"] / old["time"]["median"],
+            "old_memory_kb": old["memory_kb"],
+            "new_memory_kb": new["memory_kb"],
+            "time_regression": is_time_regression(old["time"], new["time"]),
+            "memory_regression": is_memory_regression(old["memory_kb"], new["memory_kb"]),
+            "program_changed": old["program_hash"] != new["program_hash"],
+            "input_changed": old["input_hash"] != new["input_hash"],
+            "interpreter_changed": old["interpreter_version"] != new["interpreter_version"],
+        })
+
+    return rows
+
+
+def is_exponent_change(old: dict, new: dict) -> bool:
+    if old["r2"] < MIN_FIT_R2 or new["r2"] < MIN_FIT_R2:
+        return False
+    return abs(new["exponent"] - old["exponent"]) > EXPONENT_THRESHOLD
+
+
+def compare_fits(root: pathlib.Path, ref: str) -> list[dict]:
+    """
+    Compare the latest complexity fits against the latest ones taken at ref.
+
+    Returns one row per (day, interpreter, measure) present in both.
+    """
+    records = [r for r in load_records(root) if r["mode"] == SCALE_MODE]
+    baseline_commit = git_commit(root, ref)
+
+    baseline = latest_by_key([r for r in records if r["commit"] == baseline_commit])
+    current = latest_by_key(records)
+
+    rows: list[dict] = []
+    for key, new in sorted(current.items()):
+        old = baseline.get(key)
+        if old is None or old is new:
+            continue
+
+        _, day, interpreter = key
+        for measure, new_fit in new["fits"].items():
+            old_fit = old["fits"].get(measure)
+            if old_fit is None:
+                continue
+            rows.append({
+                "day": day,
+                "interpreter": interpreter,
+                "measure": measure,
+                "old_exponent": old_fit["exponent"],
+                "new_exponent": new_fit["exponent"],
+                "old_model": old_fit["model"],
+                "new_model": new_fit["model"],
+                "exponent_changed": is_exponent_change(old_fit, new_fit),
+                "program_changed": old["program_hash"] != new["program_hash"],
+            })
+
+    return rows
@@ -0,0 +1,51 @@
+"""
+Minimal launcher that runs one command and reports its resource usage.
+
+Usage: python -S bench/launch.py <command> [<arg> ...]
+
+On Linux a child's ru_maxrss starts from the peak RSS of the process that
+spawned it, so spawning programs straight from measure.py (which has pandas
+loaded) would inflate their memory. This script keeps the spawning process
+small: it runs the command with inherited stdin, discards its output, reaps it
+with os.wait4 and prints the usage as one JSON object.
+"""
+
+import json
+import os
+import sys
+import time
+
+
+def main() -> int:
+    cmd = sys.argv[1:]
+    devnull = os.open(os.devnull, os.O_WRONLY)
+
+    start_ns = time.perf_counter_ns()
+    pid = os.posix_spawnp(
+        cmd[0],
+        cmd,
+        os.environ,
+        file_actions=[
+            (os.POSIX_SPAWN_DUP2, devnull, 1),
+            (os.POSIX_SPAWN_DUP2, devnull, 2),
+        ],
+    )
+    _, status, rusage = os.wait4(pid, 0)
+    wall_ns = time.perf_counter_ns() - start_ns
+
+    print(json.dumps({
+        "returncode": os.waitstatus_to_exitcode(status),
+        "wall_s": wall_ns / 1e9,
+        "user_s": rusage.ru_utime,
+        "system_s": rusage.ru_stime,
+        "maxrss_kb": rusage.ru_maxrss,
+        "minflt": rusage.ru_minflt,
+        "majflt": rusage.ru_majflt,
+        "nvcsw": rusage.ru_nvcsw,
+        "nivcsw": rusage.ru_nivcsw,
+    }))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+"""
+Memory instrumentation.
+
+sample_rss() runs a program and samples its RSS from /proc while it runs.
+Run as a module inside the interpreter being measured, this traces each
+phase (parse, part1, part2 or parts) with tracemalloc instead:
+
+Usage: python -m bench.memory <root> <day> [--top N] [--input PATH]
+
+Prints one JSON object with the peak traced memory of every phase and the
+top allocation sites close to that peak. With --top 0 only the peaks are
+traced, which is much cheaper.
+"""
+
+import argparse
+import json
+import pathlib
+import subprocess
+import sys
+import threading
+import time
+
+try:
+    import tracemalloc
+except ImportError:  # PyPy
+    tracemalloc = None
+
+from bench.worker import call_part, load_program
+
+# Take a new snapshot whenever traced memory grows by this factor
+SNAPSHOT_GROWTH = 1.1
+
+EXCLUDED_FILES = ["<frozen *>", "<unknown>", "*/tracemalloc.py", str(pathlib.Path(__file__).parent / "*")]
+
+
+def read_status_kb(pid: int, field: str) -> int | None:
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1])
+    except (FileNotFoundError, ProcessLookupError):
+        pass
+    return None
+
+
+def sample_rss(cmd: list[str], stdin_f, interval: float) -> tuple[int, int | None, list[tuple[float, int]]]:
+    """
+    Run cmd and sample its RSS every `interval` seconds.
+
+    Returns (exit code, peak RSS in KB, timeline of (seconds, RSS in KB)).
+    The peak comes from VmHWM, so it also covers spikes between samples.
+    """
+    timeline: list[tuple[float, int]] = []
+    peak_kb: int | None = None
+
+    proc = subprocess.Popen(cmd, stdin=stdin_f, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    start = time.perf_counter()
+    done = threading.Event()
+
+    def sampler() -> None:
+        nonlocal peak_kb
+        while not done.is_set():
+            rss_kb = read_status_kb(proc.pid, "VmRSS")
+            hwm_kb = read_status_kb(proc.pid, "VmHWM")
+            if rss_kb is not None:
+                timeline.append((time.perf_counter() - start, rss_kb))
+            if hwm_kb is not None:
+                peak_kb = max(peak_kb or 0, hwm_kb)
+            done.wait(interval)
+
+    thread = threading.Thread(target=sampler, daemon=True)
+    thread.start()
+    returncode = proc.wait()
+    done.set()
+    thread.join()
+
+    return returncode, peak_kb, timeline
+
+
+class PeakSnapshots:
+    """Profile hook that snapshots tracemalloc each time traced memory reaches a new high."""
+
+    def __init__(self) -> None:
+        self.best = 0
+        self.snapshot = None
+
+    def __call__(self, frame, event: str, arg) -> None:
+        if event not in ("return", "c_return"):
+            return
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self.best * SNAPSHOT_GROWTH:
+            self.best = current
+            self.snapshot = tracemalloc.take_snapshot()
+
+
+def tracing_available() -> bool:
+    if tracemalloc is None:
+        return False
+    try:
+        tracemalloc.start()
+    except (NotImplementedError, RuntimeError):
+        return False
+    tracing = tracemalloc.is_tracing()
+    tracemalloc.stop()
+    return tracing
+
+
+def trace_phase(func, top: int) -> tuple[object, dict | None]:
+    """
+    Run func() with only its own allocations traced. Returns (result, phase report).
+
+    The report is None when the interpreter has no tracemalloc (PyPy).
+    """
+    if not tracing_available():
+        return func(), None
+
+    tracemalloc.start()
+    snapshots = PeakSnapshots()
+    if top > 0:
+        sys.setprofile(snapshots)
+    try:
+        result = func()
+    finally:
+        sys.setprofile(None)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    sites: list[tuple[str, float, int]] = []
+    if snapshots.snapshot is not None:
+        snapshot = snapshots.snapshot.filter_traces([tracemalloc.Filter(False, f) for f in EXCLUDED_FILES])
+        for stat in snapshot.statistics("lineno")[:top]:
+            frame = stat.traceback[0]
+            sites.append((f"{pathlib.Path(frame.filename).name}:{frame.lineno}", stat.size / 1024, stat.count))
+
+    return result, {"peak_kb": peak / 1024, "top": sites}
+
+
+def trace_day(day_path: pathlib.Path, top: int, in_path: pathlib.Path | None = None) -> dict:
+    module = load_program(day_path)
+    data = (in_path or day_path / "in.txt").read_bytes()
+
+    phases: dict[str, dict | None] = {}
+    parsed, phases["parse"] = trace_phase(lambda: module.parse(data), top)
+    if hasattr(module, "parts"):
+        _, phases["parts"] = trace_phase(lambda: call_part(module.parts, parsed), top)
+    else:
+        _, phases["part1"] = trace_phase(lambda: call_part(module.part1, parsed), top)
+        _, phases["part2"] = trace_phase(lambda: call_part(module.part2, parsed), top)
+
+    return {"ok": True, "phases": phases}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Trace allocations of a day's phases.")
+    parser.add_argument("root", type=pathlib.Path)
+    parser.add_argument("day", type=int)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--input", type=pathlib.Path)
+    args = parser.parse_args()
+
+    try:
+        result = trace_day(args.root / "day" / f"{args.day:02d}", args.top, args.input)
+    except Exception as err:
+        result = {"ok": False, "error": f"{type(err).__name__}: {err}"}
+
+    print(json.dumps(result))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
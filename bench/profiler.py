@@ -0,0 +1,182 @@
+"""
+Profile one day's main() inside the interpreter being measured.
+
+Usage: python -m bench.profiler <root> <day> <out prefix> [--backend ...] [--top N]
+
+Writes <out prefix>.collapsed with collapsed stacks ("a;b;c weight" per line,
+as consumed by flamegraph.pl or speedscope) and <out prefix>.txt with the
+top-N hot functions. The cprofile backend also writes <out prefix>.pstats.
+The sample backend uses a SIGPROF interval timer instead of cProfile.
+"""
+
+import argparse
+import collections
+import contextlib
+import cProfile
+import io
+import pathlib
+import pstats
+import signal
+import sys
+from types import FrameType
+
+from bench.worker import load_program
+
+# Drop call paths that carry less than this many seconds
+MIN_PATH_TIME = 1e-6
+MAX_STACK_DEPTH = 128
+
+Func = tuple[str, int, str]  # (filename, line, function name) as used by pstats
+
+
+def output_path(out_prefix: pathlib.Path, suffix: str) -> pathlib.Path:
+    return out_prefix.with_name(out_prefix.name + suffix)
+
+
+def frame_label(filename: str, line: int, name: str) -> str:
+    if filename == "~":
+        return name  # Built-in functions
+    return f"{name} ({pathlib.Path(filename).name}:{line})"
+
+
+def run_main(day_path: pathlib.Path):
+    """Return a callable that runs the day's main() on its in.txt with output captured."""
+    module = load_program(day_path)
+    data = (day_path / "in.txt").read_bytes()
+
+    def run() -> None:
+        stdin = sys.stdin
+        sys.stdin = io.TextIOWrapper(io.BytesIO(data))
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                module.main()
+        finally:
+            sys.stdin = stdin
+
+    return run
+
+
+def collapse_pstats(stats: pstats.Stats) -> dict[str, float]:
+    """
+    Rebuild collapsed stacks from cProfile's caller graph.
+
+    cProfile only records caller/callee edges, so each function's own time is
+    split over the paths leading to it in proportion to the time spent along
+    each edge. Returns stack -> seconds.
+    """
+    entries = stats.stats  # type: ignore[attr-defined]
+
+    callees: dict[Func, dict[Func, float]] = collections.defaultdict(dict)
+    for func, (_, _, _, _, callers) in entries.items():
+        for caller, (_, _, _, edge_ct) in callers.items():
+            callees[caller][func] = edge_ct
+
+    roots = [func for func, (_, _, _, _, callers) in entries.items() if not callers]
+    stacks: dict[str, float] = collections.defaultdict(float)
+
+    def walk(func: Func, budget: float, path: list[Func]) -> None:
+        _, _, tt, ct, _ = entries[func]
+        if ct <= 0 or budget < MIN_PATH_TIME or len(path) >= MAX_STACK_DEPTH:
+            return
+
+        path.append(func)
+        stacks[";".join(frame_label(*f) for f in path)] += budget * min(tt / ct, 1.0)
+        for callee, edge_ct in callees.get(func, {}).items():
+            if callee not in path:
+                walk(callee, budget * edge_ct / ct, path)
+        path.pop()
+
+    for root in roots:
+        walk(root, entries[root][3], [])
+
+    return stacks
+
+
+def profile_cprofile(run, out_prefix: pathlib.Path, top: int) -> None:
+    profiler = cProfile.Profile()
+    profiler.runcall(run)
+    profiler.dump_stats(str(output_path(out_prefix, ".pstats")))
+
+    summary = io.StringIO()
+    stats = pstats.Stats(profiler, stream=summary)
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(top)
+    output_path(out_prefix, ".txt").write_text(summary.getvalue())
+
+    stacks = collapse_pstats(stats)
+    write_collapsed(out_prefix, {stack: round(seconds * 1e6) for stack, seconds in stacks.items()})
+
+
+def profile_sample(run, out_prefix: pathlib.Path, top: int, interval: float) -> None:
+    samples: collections.Counter[str] = collections.Counter()
+
+    def on_signal(signum: int, frame: FrameType | None) -> None:
+        labels: list[str] = []
+        while frame is not None:
+            code = frame.f_code
+            labels.append(frame_label(code.co_filename, code.co_firstlineno, code.co_name))
+            # Stacks start at run(), like the cProfile ones, without the harness above it
+            if code is run.__code__:
+                break
+            frame = frame.f_back
+        samples[";".join(reversed(labels))] += 1
+
+    previous = signal.signal(signal.SIGPROF, on_signal)
+    signal.setitimer(signal.ITIMER_PROF, interval, interval)
+    try:
+        run()
+    finally:
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, previous)
+
+    write_collapsed(out_prefix, samples)
+
+    own: collections.Counter[str] = collections.Counter()
+    inclusive: collections.Counter[str] = collections.Counter()
+    for stack, count in samples.items():
+        frames = stack.split(";")
+        own[frames[-1]] += count
+        for label in set(frames):
+            inclusive[label] += count
+
+    total = sum(samples.values())
+    if not total:
+        # The program finished before the first interval ended
+        output_path(out_prefix, ".txt").write_text(f"no samples (sampling every {interval * 1e3:g} ms)\n")
+        return
+
+    lines = [f"{total} samples every {interval * 1e3:g} ms", "", "   own%   incl%  function"]
+    for label, count in own.most_common(top):
+        lines.append(f"{100 * count / total:7.1f} {100 * inclusive[label] / total:7.1f}  {label}")
+    output_path(out_prefix, ".txt").write_text("\n".join(lines) + "\n")
+
+
+def write_collapsed(out_prefix: pathlib.Path, stacks: dict[str, int]) -> None:
+    with output_path(out_prefix, ".collapsed").open("w") as f:
+        for stack, weight in sorted(stacks.items()):
+            if weight > 0:
+                f.write(f"{stack} {weight}\n")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Profile a day's main().")
+    parser.add_argument("root", type=pathlib.Path)
+    parser.add_argument("day", type=int)
+    parser.add_argument("out_prefix", type=pathlib.Path)
+    parser.add_argument("--backend", choices=["cprofile", "sample"], default="cprofile")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--interval", type=float, default=0.001, help="sampling interval in seconds")
+    args = parser.parse_args()
+
+    run = run_main(args.root / "day" / f"{args.day:02d}")
+    args.out_prefix.parent.mkdir(parents=True, exist_ok=True)
+
+    if args.backend == "cprofile":
+        profile_cprofile(run, args.out_prefix, args.top)
+    else:
+        profile_sample(run, args.out_prefix, args.top, args.interval)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
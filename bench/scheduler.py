@@ -0,0 +1,49 @@
+"""
+Parallel measurement scheduler.
+
+Independent measurements run in a process pool whose workers are each pinned
+to their own cores with os.sched_setaffinity. Measured children inherit the
+affinity, so concurrent runs do not compete for a core. The first cores can
+be reserved for the main process and the rest of the system.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+
+def available_cores(reserve_cores: int) -> list[int]:
+    """Cores this process may use, without the first `reserve_cores` of them."""
+    cores = sorted(os.sched_getaffinity(0))
+    if reserve_cores >= len(cores):
+        raise ValueError(f"Cannot reserve {reserve_cores} of {len(cores)} available cores")
+    return cores[reserve_cores:]
+
+
+def pin_to_cores(core_sets: multiprocessing.Queue) -> None:
+    """Pool initializer: take a set of cores from the queue and pin this worker to it."""
+    os.sched_setaffinity(0, core_sets.get())
+
+
+def pinned_pool(jobs: int, reserve_cores: int = 0, cores_per_job: int = 1) -> ProcessPoolExecutor:
+    """
+    Return a process pool with up to `jobs` workers, each on `cores_per_job` cores of its own.
+
+    The number of workers is limited by the cores left after reserving. If
+    fewer than `cores_per_job` are left, a single worker gets all of them.
+    """
+    cores = available_cores(reserve_cores)
+    count = max(1, min(jobs, len(cores) // cores_per_job))
+    core_sets = [set(cores[i * cores_per_job:(i + 1) * cores_per_job]) for i in range(count)]
+
+    context = multiprocessing.get_context()
+    queue = context.Queue()
+    for core_set in core_sets:
+        queue.put(core_set)
+
+    return ProcessPoolExecutor(
+        max_workers=len(core_sets),
+        mp_context=context,
+        initializer=pin_to_cores,
+        initargs=(queue,),
+    )
@@ -0,0 +1,111 @@
+"""
+Statistics for benchmark samples.
+
+Only the standard library is used, so this module can be imported by
+bench.worker under any interpreter.
+"""
+
+import math
+import statistics
+from collections.abc import Callable
+from typing import NamedTuple, TypeVar
+
+T = TypeVar("T")
+
+# Two-sided 95% Student's t critical values for 1..30 degrees of freedom
+T_CRITICAL_95 = [
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+]
+Z_95 = 1.960
+
+OUTLIER_IQR_FACTOR = 1.5
+
+# Keys of the dict returned by summarize()
+SUMMARY_KEYS = ("min", "median", "p95", "stddev", "mean", "runs")
+
+
+class SamplingPlan(NamedTuple):
+    """How many runs to make before and while sampling."""
+
+    warmup: int
+    min_repeats: int
+    max_repeats: int
+    ci_width: float  # Target relative width of the 95% confidence interval
+
+
+def outlier_mask(values: list[float]) -> list[bool]:
+    """
+    Return True for each value inside Tukey's fences.
+
+    Fewer than four values are always kept.
+    """
+    if len(values) < 4:
+        return [True] * len(values)
+
+    q1, _, q3 = statistics.quantiles(values, n=4, method="inclusive")
+    spread = OUTLIER_IQR_FACTOR * (q3 - q1)
+    low, high = q1 - spread, q3 + spread
+    return [low <= value <= high for value in values]
+
+
+def reject_outliers(values: list[float]) -> list[float]:
+    return [value for value, keep in zip(values, outlier_mask(values)) if keep]
+
+
+def relative_ci_width(values: list[float]) -> float:
+    """Width of the 95% confidence interval of the mean, relative to the mean."""
+    n = len(values)
+    if n < 2:
+        return math.inf
+
+    mean = statistics.fmean(values)
+    if mean == 0:
+        return 0.0
+
+    t = T_CRITICAL_95[n - 2] if n - 1 <= len(T_CRITICAL_95) else Z_95
+    half_width = t * statistics.stdev(values) / math.sqrt(n)
+    return 2 * half_width / mean
+
+
+def summarize(values: list[float]) -> dict[str, float]:
+    """Return min/median/p95/stddev/mean and count of the values."""
+    if len(values) >= 2:
+        p95 = statistics.quantiles(values, n=20, method="inclusive")[18]
+        stddev = statistics.stdev(values)
+    else:
+        p95 = values[0]
+        stddev = 0.0
+
+    return {
+        "min": min(values),
+        "median": statistics.median(values),
+        "p95": p95,
+        "stddev": stddev,
+        "mean": statistics.fmean(values),
+        "runs": len(values),
+    }
+
+
+def sample(run: Callable[[], T], key: Callable[[T], float], plan: SamplingPlan) -> list[T]:
+    """
+    Call run() repeatedly and return the results after warmup.
+
+    Sampling stops once at least plan.min_repeats results have been taken
+    and the confidence interval of key(result), with outliers removed, is
+    narrower than plan.ci_width, or after plan.max_repeats results.
+    """
+    for _ in range(plan.warmup):
+        run()
+
+    results: list[T] = []
+    while len(results) < plan.max_repeats:
+        results.append(run())
+        if len(results) < plan.min_repeats:
+            continue
+        values = reject_outliers([key(result) for result in results])
+        if relative_ci_width(values) <= plan.ci_width:
+            break
+
+    return results
@@ -0,0 +1,154 @@
+"""
+In-process benchmark worker.
+
+Runs under the interpreter being measured. Each day's program.py is imported
+once as a module, then parse, part1 and part2 (or parts) are timed separately
+with time.perf_counter_ns, repeating inside the same process.
+
+Usage: python -m bench.worker <root> <day> [<day> ...] [sampling options] [--input PATH] [--concurrent-parts]
+
+With --input, every day reads that file instead of its in.txt and the
+answers are not checked against out.txt. With --concurrent-parts, days that
+set PARTS_INDEPENDENT run part1 and part2 on two threads, timed together
+as "parts".
+
+One JSON object per day is written to stdout, with one entry per measured
+run after warmup:
+{"day": 1, "ok": true, "runs": [{"parse": ns, "part1": ns, "part2": ns}, ...]}
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import json
+import pathlib
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+
+from bench.stats import SamplingPlan, sample
+
+# Threads used with --concurrent-parts: part2 on the main thread, part1 on a helper
+PARTS_THREADS = 2
+
+
+def load_program(day_path: pathlib.Path) -> ModuleType:
+    """Import day_path/program.py without running its main()."""
+    spec = importlib.util.spec_from_file_location(f"day{day_path.name}", day_path / "program.py")
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def read_answers(day_path: pathlib.Path) -> list[str]:
+    """Return the expected answers from out.txt, one per part."""
+    lines = (day_path / "out.txt").read_text().splitlines()
+    return [line.split(":", 1)[1].strip() for line in lines if ":" in line]
+
+
+def call_part(func, parsed):
+    """
+    Call a part function with the value returned by parse().
+
+    A tuple is spread into positional arguments, anything else is passed as
+    the single argument.
+    """
+    if isinstance(parsed, tuple):
+        return func(*parsed)
+    return func(parsed)
+
+
+def run_once(
+    module: ModuleType,
+    data: bytes,
+    pool: ThreadPoolExecutor | None = None,
+) -> tuple[dict[str, int], list[str]]:
+    """
+    Run parse and the parts once. Returns (phase timings in ns, answers).
+
+    With a pool, part1 runs on it while part2 runs on this thread.
+    """
+    timings: dict[str, int] = {}
+
+    t0 = time.perf_counter_ns()
+    parsed = module.parse(data)
+    t1 = time.perf_counter_ns()
+    timings["parse"] = t1 - t0
+
+    if hasattr(module, "parts"):
+        answers = call_part(module.parts, parsed)
+        t2 = time.perf_counter_ns()
+        timings["parts"] = t2 - t1
+    elif pool is not None:
+        future = pool.submit(call_part, module.part1, parsed)
+        answer2 = call_part(module.part2, parsed)
+        answers = (future.result(), answer2)
+        t2 = time.perf_counter_ns()
+        timings["parts"] = t2 - t1
+    else:
+        answer1 = call_part(module.part1, parsed)
+        t2 = time.perf_counter_ns()
+        answer2 = call_part(module.part2, parsed)
+        t3 = time.perf_counter_ns()
+        timings["part1"] = t2 - t1
+        timings["part2"] = t3 - t2
+        answers = (answer1, answer2)
+
+    return timings, [str(answer) for answer in answers]
+
+
+def measure_day(
+    day_path: pathlib.Path,
+    plan: SamplingPlan,
+    in_path: pathlib.Path | None = None,
+    concurrent_parts: bool = False,
+) -> dict:
+    """Import one day and time it according to the sampling plan."""
+    module = load_program(day_path)
+    data = (in_path or day_path / "in.txt").read_bytes()
+    expected = read_answers(day_path) if in_path is None else None
+
+    concurrent = concurrent_parts and getattr(module, "PARTS_INDEPENDENT", False)
+    with ThreadPoolExecutor(max_workers=PARTS_THREADS - 1) if concurrent else contextlib.nullcontext() as pool:
+
+        def run() -> dict[str, int]:
+            timings, answers = run_once(module, data, pool)
+            if expected is not None and answers != expected:
+                raise ValueError(f"wrong answers {answers}, expected {expected}")
+            return timings
+
+        runs = sample(run, lambda timings: sum(timings.values()), plan)
+
+    return {"ok": True, "runs": runs}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Time days inside this interpreter.")
+    parser.add_argument("root", type=pathlib.Path)
+    parser.add_argument("days", type=int, nargs="+")
+    parser.add_argument("--warmup", type=int, default=0)
+    parser.add_argument("--min-repeats", type=int, default=1)
+    parser.add_argument("--max-repeats", type=int, default=1)
+    parser.add_argument("--ci-width", type=float, default=0.0)
+    parser.add_argument("--input", type=pathlib.Path)
+    parser.add_argument("--concurrent-parts", action="store_true")
+    args = parser.parse_args()
+
+    plan = SamplingPlan(args.warmup, args.min_repeats, args.max_repeats, args.ci_width)
+
+    for day in args.days:
+        day_path = args.root / "day" / f"{day:02d}"
+        try:
+            result = measure_day(day_path, plan, args.input, args.concurrent_parts)
+        except Exception as err:
+            result = {"ok": False, "error": f"{type(err).__name__}: {err}"}
+        result["day"] = day
+        print(json.dumps(result), flush=True)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
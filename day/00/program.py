@@ -4,22 +4,35 @@ Author: ${name} <${email}>
 """
 
 import sys
+from pathlib import Path
+
+# Make the repository root importable when run as a script
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from aoclib import fastio  # noqa: E402
+
+# part1 and part2 leave the parsed data unchanged, so runners may call them concurrently
+PARTS_INDEPENDENT = True
 
 
 def main() -> int:
-    sys.stdin
+    data = parse(fastio.read_input())
 
-    print("Part 1:", part1())
-    print("Part 2:", part2())
+    print("Part 1:", part1(data))
+    print("Part 2:", part2(data))
 
     return 0
 
 
-def part1():
+def parse(data: fastio.Buffer):
+    return fastio.text(data)
+
+
+def part1(data):
     pass
 
 
-def part2():
+def part2(data):
     pass
 
 
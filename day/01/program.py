@@ -3,63 +3,129 @@ Advent of Code 2025 - Day 1: Secret Entrance
 Author: kimerikal <kimerikal.games@gmail.com>
 """
 
+import io
+import re
 import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import BinaryIO
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from aoclib import backend, fastio  # noqa: E402
+
+Source = BinaryIO | bytes
+
+CHUNK_SIZE = 1 << 16
+NUMPY_CHUNK_SIZE = 1 << 20
+
+# Once directions are replaced by signs, instructions consist of these
+SIGNED_DIGITS = b"-0123456789"
+LONE_SIGN = re.compile(rb"-(?!\d)")
 
 
 def main() -> int:
-    instructions = sys.stdin.read().split()
+    source: Source = sys.stdin.buffer
+    if backend.selected() == "check":
+        # Both backends read the log
+        source = source.read()
+
+    part1_answer, part2_answer = backend.run(solve, solve_numpy, source)
 
-    print("Part 1:", part1(instructions))
-    print("Part 2:", part2(instructions))
+    print("Part 1:", part1_answer)
+    print("Part 2:", part2_answer)
 
     return 0
 
 
-def part1(instructions: list[str]) -> int:
-    cnt_zeros = 0
-    position = 50
+def parse(data: fastio.Buffer) -> bytes:
+    return bytes(data)
 
-    for instruction in instructions:
-        direction = instruction[0]
-        distance = int(instruction[1:])
 
-        match direction:
-            case "L":
-                position = (position - distance) % 100
-            case "R":
-                position = (position + distance) % 100
-            case _:
-                raise ValueError(f"Unknown value {direction=}")
+def parts(log: bytes) -> tuple[int, int]:
+    """Entry point for the benchmarks, which pass the whole log."""
+    return backend.run(solve, solve_numpy, log)
 
-        if position == 0:
-            cnt_zeros += 1
 
-    password = cnt_zeros
-    return password
+def read_chunks(source: Source, chunk_size: int) -> Iterator[bytes]:
+    """Yield a rotation log in chunks of whole lines, reading it chunk by chunk."""
+    stream = io.BytesIO(source) if isinstance(source, bytes) else source
+    tail = b""
+    while chunk := stream.read(chunk_size):
+        # The last line may continue in the next chunk
+        lines, _, tail = (tail + chunk).rpartition(b"\n")
+        if lines:
+            yield lines
+    if tail:
+        yield tail
 
 
-def part2(instructions: list[str]) -> int:
+def read_instructions(source: Source, chunk_size: int) -> Iterator[bytes]:
+    for chunk in read_chunks(source, chunk_size):
+        yield from chunk.split()
+
+
+def solve(source: Source, chunk_size: int = CHUNK_SIZE) -> tuple[int, int]:
+    """Both parts in a single pass over the log, in constant memory."""
+    cnt_zeros = 0
     cnt_turns = 0
     position = 50
 
-    for instruction in instructions:
-        direction = instruction[0]
+    for instruction in read_instructions(source, chunk_size):
+        direction = instruction[:1]
         distance = int(instruction[1:])
 
         match direction:
-            case "L":
+            case b"L":
                 position = -position % 100
                 turns, position = divmod(position + distance, 100)
                 position = -position % 100
-            case "R":
+            case b"R":
                 turns, position = divmod(position + distance, 100)
             case _:
                 raise ValueError(f"Unknown value {direction=}")
 
         cnt_turns += turns
+        if position == 0:
+            cnt_zeros += 1
+
+    return cnt_zeros, cnt_turns
+
+
+def solve_numpy(source: Source, chunk_size: int = NUMPY_CHUNK_SIZE) -> tuple[int, int]:
+    """
+    Like solve(), but each chunk of instructions at once.
+
+    With S the unwrapped position after each rotation, a rotation right from
+    S' passes 0 floor(S / 100) - floor(S' / 100) times, and a rotation left
+    floor((S' - 1) / 100) - floor((S - 1) / 100) times.
+    """
+    import numpy as np
+
+    cnt_zeros = 0
+    cnt_turns = 0
+    position = 50
 
-    password = cnt_turns
-    return password
+    for chunk in read_chunks(source, chunk_size):
+        chunk = chunk.strip().replace(b"L", b"-").replace(b"R", b"")
+        if not chunk:
+            continue
+        if chunk.translate(None, SIGNED_DIGITS).strip() or LONE_SIGN.search(chunk):
+            raise ValueError(f"Unknown directions in {chunk[:80]!r}")
+        distances = np.fromstring(chunk, dtype=np.int64, sep=" ")
+        if len(distances) != chunk.count(b"\n") + 1:
+            raise ValueError(f"Expected one instruction per line in {chunk[:80]!r}")
+
+        unwrapped = position + np.cumsum(distances)
+        previous = np.concatenate(([position], unwrapped[:-1]))
+        right = unwrapped // 100 - previous // 100
+        left = (previous - 1) // 100 - (unwrapped - 1) // 100
+
+        cnt_turns += int(np.where(distances > 0, right, left).sum())
+        cnt_zeros += int(np.count_nonzero(unwrapped % 100 == 0))
+        position = int(unwrapped[-1]) % 100
+
+    return cnt_zeros, cnt_turns
 
 
 if __name__ == "__main__":
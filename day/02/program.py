@@ -3,16 +3,33 @@ Advent of Code 2025 - Day 2: Gift Shop
 Author: kimerikal <kimerikal.games@gmail.com>
 """
 
+import math
 import sys
-from itertools import count
+from functools import cache
+from itertools import combinations
+from pathlib import Path
+from typing import NamedTuple
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from aoclib import fastio  # noqa: E402
+
+IdRange = tuple[int, int]
+
+PARTS_INDEPENDENT = True
+
+
+class Series(NamedTuple):
+    """IDs seed * multiplier for seeds first..last, added to a sum with the given sign."""
+
+    sign: int
+    multiplier: int
+    first: int
+    last: int
 
 
 def main() -> int:
-    tokens = sys.stdin.read().strip().split(",")
-    id_ranges: list[tuple[int, int]] = []
-    for token in tokens:
-        start, end = map(int, token.split("-"))
-        id_ranges.append((start, end))
+    id_ranges = parse(fastio.read_input())
 
     print("Part 1:", part1(id_ranges))
     print("Part 2:", part2(id_ranges))
@@ -20,62 +37,92 @@ def main() -> int:
     return 0
 
 
-def part1(id_ranges: list[tuple[int, int]]) -> int:
-    total = 0
+def parse(data: fastio.Buffer) -> list[IdRange]:
+    bounds = fastio.iter_ints(data)
+    return list(zip(bounds, bounds))
 
-    for start, end in id_ranges:
-        start_len = count_digits(start)
-        candidate_start_len = (start_len + 1) // 2
-        candidate = 10 ** (candidate_start_len - 1)
 
-        for candidate in count(candidate):
-            doubled = duplicate(candidate, 2)
-            if doubled > end:
-                break
-            if doubled < start:
-                continue
-            total += doubled
+def part1(id_ranges: list[IdRange]) -> int:
+    return sum(range_sum(start, end, exactly_twice=True) for start, end in merge_ranges(id_ranges))
 
-    return total
 
+def part2(id_ranges: list[IdRange]) -> int:
+    return sum(range_sum(start, end, exactly_twice=False) for start, end in merge_ranges(id_ranges))
 
-def part2(id_ranges: list[tuple[int, int]]) -> int:
-    total = 0
 
-    for start, end in id_ranges:
-        visited: set[int] = set()
+def merge_ranges(id_ranges: list[IdRange]) -> list[IdRange]:
+    """Sorted, disjoint ranges covering the same IDs, so no ID is counted twice."""
+    merged: list[IdRange] = []
 
-        for candidate in count(1):
-            if duplicate(candidate, 2) > end:
-                break
+    for start, end in sorted((min(bounds), max(bounds)) for bounds in id_ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
 
-            candidate_str = str(candidate)
-            candidate_len = len(candidate_str)
+    return merged
 
-            max_repetition = len(str(end)) // candidate_len
-            if max_repetition == 0:
-                continue
-            min_repetition = -(-count_digits(start) // candidate_len)
 
-            for repetition in range(min_repetition, max_repetition + 1):
-                repeated = duplicate(candidate, repetition)
-                if repeated < start:
-                    continue
-                if repeated > end:
-                    break
-                if repeated not in visited:
-                    visited.add(repeated)
-                    total += repeated
+def range_sum(start: int, end: int, exactly_twice: bool) -> int:
+    """Sum of the invalid IDs in [start, end]."""
+    total = 0
+
+    for digits in range(count_digits(start), count_digits(end) + 1):
+        for sign, multiplier, first, last in invalid_series(digits, exactly_twice):
+            low = max(first, -(-start // multiplier))
+            high = min(last, end // multiplier)
+            if low <= high:
+                total += sign * multiplier * (low + high) * (high - low + 1) // 2
 
     return total
 
 
-def count_digits(n: int) -> int:
-    return len(str(n))
+@cache
+def invalid_series(digits: int, exactly_twice: bool) -> tuple[Series, ...]:
+    """
+    Series whose signed sums give the invalid IDs of the given length.
+
+    An ID made of a seed of period p is seed * (10^digits - 1) / (10^p - 1),
+    e.g. 121212 = 12 * 10101. It also has every period that divides the
+    length and is a multiple of its shortest one, so with repeats of any
+    count it is counted once by inclusion-exclusion over the periods
+    digits / d for the square-free d > 1 dividing digits.
+    """
+    if exactly_twice:
+        divisors = [(1, 2)] if digits % 2 == 0 else []
+    else:
+        primes = prime_factors(digits)
+        divisors = [
+            (1 if k % 2 else -1, math.prod(factors))
+            for k in range(1, len(primes) + 1)
+            for factors in combinations(primes, k)
+        ]
+
+    series: list[Series] = []
+    for sign, divisor in divisors:
+        period = digits // divisor
+        multiplier = (10**digits - 1) // (10**period - 1)
+        series.append(Series(sign, multiplier, 10 ** (period - 1), 10**period - 1))
+
+    return tuple(series)
+
+
+def prime_factors(n: int) -> list[int]:
+    primes: list[int] = []
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            primes.append(p)
+            while n % p == 0:
+                n //= p
+        p += 1
+    if n > 1:
+        primes.append(n)
+    return primes
 
 
-def duplicate(n: int, k: int) -> int:
-    return int(str(n) * k)
+def count_digits(n: int) -> int:
+    return len(str(n))
 
 
 if __name__ == "__main__":
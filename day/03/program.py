@@ -4,64 +4,99 @@ Author: kimerikal <kimerikal.games@gmail.com>
 """
 
 import sys
+from pathlib import Path
 
-TEN = 10
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from aoclib import backend, fastio  # noqa: E402
+
+PART1_RESULT_LENGTH = 2
 PART2_RESULT_LENGTH = 12
 
+# Joltages with more digits overflow int64
+MAX_NUMPY_RESULT_LENGTH = 18
+
+PARTS_INDEPENDENT = True
+
 
 def main() -> int:
-    banks = [list(map(int, line)) for line in sys.stdin.read().split()]
+    banks = parse(fastio.read_input())
 
-    print("Part 1:", part1(banks))
-    print("Part 2:", part2(banks))
+    print("Part 1:", backend.run(part1, part1_numpy, banks))
+    print("Part 2:", backend.run(part2, part2_numpy, banks))
 
     return 0
 
 
-def part1(banks: list[list[int]]) -> int:
-    total_joltage = 0
+def parse(data: fastio.Buffer) -> list[bytes]:
+    return [bytes(line) for line in fastio.records(data) if line]
+
+
+def part1(banks: list[bytes]) -> int:
+    return sum(max_joltage(bank, PART1_RESULT_LENGTH) for bank in banks)
+
+
+def part2(banks: list[bytes]) -> int:
+    return sum(max_joltage(bank, PART2_RESULT_LENGTH) for bank in banks)
+
+
+def max_joltage(bank: bytes, length: int) -> int:
+    """
+    The largest number made of `length` digits of the bank, kept in order.
+
+    Selected digits are kept on a stack, and a digit is dropped when a larger
+    one follows, as long as enough digits remain to fill the selection.
+    Digits are compared as ASCII codes, which order the same way.
+    """
+    to_drop = len(bank) - length
+    selected = bytearray()
+
+    for digit in bank:
+        while to_drop and selected and selected[-1] < digit:
+            selected.pop()
+            to_drop -= 1
+        selected.append(digit)
 
-    for bank in banks:
-        n = len(bank)
-        max_joltage = -1
+    return int(selected[:length])
 
-        for i in range(n):
-            for j in range(i + 1, n):
-                joltage = bank[i] * TEN + bank[j]
-                if joltage > max_joltage:
-                    max_joltage = joltage
 
-        total_joltage += max_joltage
+def part1_numpy(banks: list[bytes]) -> int:
+    return total_joltage_numpy(banks, PART1_RESULT_LENGTH)
 
-    return total_joltage
 
+def part2_numpy(banks: list[bytes]) -> int:
+    return total_joltage_numpy(banks, PART2_RESULT_LENGTH)
 
-def part2(banks: list[list[int]]) -> int:
-    total_joltage = 0
 
-    for bank in banks:
-        result: list[int] = []
+def total_joltage_numpy(banks: list[bytes], length: int) -> int:
+    """
+    Sum of max_joltage() over all banks, selecting from every bank at once.
 
-        for digit in reversed(bank):
-            result.append(digit)
+    Each digit of the selection is the leftmost largest digit between the one
+    after the previous selection and the last one that leaves room for the
+    rest. Banks of different lengths fall back to max_joltage().
+    """
+    if not banks or len({len(bank) for bank in banks}) > 1 or length > MAX_NUMPY_RESULT_LENGTH:
+        return sum(max_joltage(bank, length) for bank in banks)
 
-            if len(result) > PART2_RESULT_LENGTH:
-                to_remove = 0
+    import numpy as np
 
-                for i in range(len(result) - 1, -1, -1):
-                    if result[i - 1] > result[i]:
-                        to_remove = i
-                        break
+    digits = (np.frombuffer(b"".join(banks), dtype=np.uint8).reshape(len(banks), -1) - ord("0")).astype(np.int8)
+    rows = np.arange(len(banks))
+    columns = np.arange(digits.shape[1])
 
-                result.pop(to_remove)
+    start = np.zeros(len(banks), dtype=np.intp)
+    joltages = np.zeros(len(banks), dtype=np.int64)
 
-        joltage = 0
-        for digit in reversed(result):
-            joltage = joltage * TEN + digit
+    for i in range(length):
+        last = digits.shape[1] - length + i
+        window = (columns >= start[:, None]) & (columns <= last)
+        chosen = np.argmax(np.where(window, digits, -1), axis=1)
 
-        total_joltage += joltage
+        joltages = joltages * 10 + digits[rows, chosen]
+        start = chosen + 1
 
-    return total_joltage
+    return sum(joltages.tolist())
 
 
 if __name__ == "__main__":
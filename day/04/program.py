@@ -4,76 +4,151 @@ Author: kimerikal <kimerikal.games@gmail.com>
 """
 
 import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-ADJACENTS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+if TYPE_CHECKING:
+    import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from aoclib import backend, fastio  # noqa: E402
+
+# Each row is an int with a set bit for every roll, the first column being the highest bit
+BITS = bytes.maketrans(b".@", b"01")
+
+PARTS_INDEPENDENT = True
 
 
 def main() -> int:
-    data = sys.stdin.read().replace(".", "0").replace("@", "1")
-    grid = [list(map(int, line)) for line in data.splitlines()]
-    rows = len(grid)
-    cols = len(grid[0])
+    cols, rows = parse(fastio.read_input())
 
-    print("Part 1:", part1(rows, cols, grid))
-    print("Part 2:", part2(rows, cols, grid))
+    print("Part 1:", backend.run(part1, part1_numpy, cols, rows))
+    print("Part 2:", backend.run(part2, part2_numpy, cols, rows))
 
     return 0
 
 
-def part1(rows: int, cols: int, grid: list[list[int]]) -> int:
-    count_accessible = 0
+def parse(data: fastio.Buffer) -> tuple[int, list[int]]:
+    cols = 0
+    rows: list[int] = []
+
+    for line in fastio.records(data):
+        if line:
+            cols = cols or len(line)
+            rows.append(int(bytes(line).translate(BITS), 2))
+
+    return cols, rows
+
+
+def part1(cols: int, rows: list[int]) -> int:
+    padded = [0, *rows, 0]
+    return sum(accessible(*padded[r - 1:r + 2]).bit_count() for r in range(1, len(padded) - 1))
 
-    for r in range(rows):
-        for c in range(cols):
-            if grid[r][c] == 0:
-                continue
 
-            count_adjacent = 0
-            for dr, dc in ADJACENTS:
-                nr, nc = r + dr, c + dc
-                if not (0 <= nr < rows and 0 <= nc < cols):
-                    continue
-                if grid[nr][nc] == 1:
-                    count_adjacent += 1
+def part2(cols: int, rows: list[int]) -> int:
+    rows = [0, *rows, 0]
+    count_removed = 0
+
+    # Only rows next to a removal can have new accessible rolls
+    to_check = set(range(1, len(rows) - 1))
+
+    while to_check:
+        next_to_check: set[int] = set()
+
+        for r in sorted(to_check):
+            removed = accessible(rows[r - 1], rows[r], rows[r + 1])
+            if removed:
+                rows[r] ^= removed
+                count_removed += removed.bit_count()
+                next_to_check.update((r - 1, r, r + 1))
+
+        next_to_check.discard(0)
+        next_to_check.discard(len(rows) - 1)
+        to_check = next_to_check
+
+    return count_removed
 
-            if count_adjacent < 4:
-                count_accessible += 1
 
-    return count_accessible
+def accessible(above: int, row: int, below: int) -> int:
+    """
+    The rolls of a row with fewer than 4 rolls among their 8 neighbours.
 
+    The 8 neighbour bits of every column are added at once by full adders on
+    whole rows, keeping only the bits of weight 4 of the sum; a count below 4
+    has neither of them set.
+    """
+    a1, a2, a3 = above << 1, above, above >> 1
+    a4, a5 = row << 1, row >> 1
+    a6, a7, a8 = below << 1, below, below >> 1
 
-def part2(rows: int, cols: int, grid: list[list[int]]) -> int:
+    # Three sums of weight 1 with carries of weight 2
+    x = a1 ^ a2
+    s1, c1 = x ^ a3, (a1 & a2) | (a3 & x)
+    x = a4 ^ a5
+    s2, c2 = x ^ a6, (a4 & a5) | (a6 & x)
+    s3, c3 = a7 ^ a8, a7 & a8
 
+    # The weight 1 sums carry once more; adding the 4 carries gives the bits of weight 4
+    x = s1 ^ s2
+    carry = (s1 & s2) | (s3 & x)
+    x = c1 ^ c2
+    twos, fours1 = x ^ c3, (c1 & c2) | (c3 & x)
+    fours2 = twos & carry
+
+    return row & ~(fours1 | fours2)
+
+
+def part1_numpy(cols: int, rows: list[int]) -> int:
+    import numpy as np
+
+    framed = roll_array(cols, rows)
+    accessible = framed[1:-1, 1:-1].astype(bool) & (neighbour_counts_numpy(framed) < 4)
+    return int(np.count_nonzero(accessible))
+
+
+def part2_numpy(cols: int, rows: list[int]) -> int:
+    import numpy as np
+
+    framed = roll_array(cols, rows)
+    inner = framed[1:-1, 1:-1]
     count_removed = 0
 
     while True:
-        accessible: list[tuple[int, int]] = []
+        accessible = inner.astype(bool) & (neighbour_counts_numpy(framed) < 4)
+        removed = int(np.count_nonzero(accessible))
+        if not removed:
+            break
 
-        for r in range(rows):
-            for c in range(cols):
-                if grid[r][c] == 0:
-                    continue
+        inner[accessible] = 0
+        count_removed += removed
 
-                count_adjacent = 0
-                for dr, dc in ADJACENTS:
-                    nr, nc = r + dr, c + dc
-                    if not (0 <= nr < rows and 0 <= nc < cols):
-                        continue
-                    if grid[nr][nc] == 1:
-                        count_adjacent += 1
+    return count_removed
 
-                if count_adjacent < 4:
-                    accessible.append((r, c))
 
-        if not accessible:
-            break
+def roll_array(cols: int, rows: list[int]) -> "np.ndarray":
+    """The rolls as a 2-D array of 0 and 1, framed by zeros."""
+    import numpy as np
 
-        for r, c in accessible:
-            grid[r][c] = 0
+    width = (cols + 7) // 8
+    packed = np.frombuffer(b"".join(row.to_bytes(width, "big") for row in rows), dtype=np.uint8)
+    bits = np.unpackbits(packed.reshape(len(rows), width), axis=1)
+    return np.pad(bits[:, bits.shape[1] - cols:], 1)
 
-        count_removed += len(accessible)
 
-    return count_removed
+def neighbour_counts_numpy(framed: "np.ndarray") -> "np.ndarray":
+    """Roll neighbours of each cell inside the frame, as the sum of the 8 shifted arrays."""
+    import numpy as np
+
+    rows, cols = framed.shape[0] - 2, framed.shape[1] - 2
+    counts = np.zeros((rows, cols), dtype=np.uint8)
+
+    for dr in range(3):
+        for dc in range(3):
+            if (dr, dc) != (1, 1):
+                counts += framed[dr:dr + rows, dc:dc + cols]
+
+    return counts
 
 
 if __name__ == "__main__":
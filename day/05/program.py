@@ -4,18 +4,20 @@ Author: kimerikal <kimerikal.games@gmail.com>
 """
 
 import sys
+from pathlib import Path
 from typing import cast
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from aoclib import fastio  # noqa: E402
+
 Interval = tuple[int, int]
 
+PARTS_INDEPENDENT = True
+
 
 def main() -> int:
-    data1, data2 = sys.stdin.read().strip().split("\n\n")
-    intervals = [
-        cast(Interval, tuple(map(int, line.split("-"))))
-        for line in data1.splitlines()
-    ]
-    ingredients = list(map(int, data2.splitlines()))
+    intervals, ingredients = parse(fastio.read_input())
 
     print("Part 1:", part1(intervals, ingredients))
     print("Part 2:", part2(intervals, ingredients))
@@ -23,6 +25,19 @@ def main() -> int:
     return 0
 
 
+def parse(data: fastio.Buffer) -> tuple[list[Interval], list[int]]:
+    # Only the first blank line separates the sections; more may trail the input
+    split = data.find(b"\n\n")
+    if split < 0:
+        raise ValueError("No blank line between the ranges and the ingredients")
+    view = memoryview(data)
+    data1, data2 = view[:split], view[split + 2:]
+    bounds = fastio.iter_ints(data1)
+    intervals = cast(list[Interval], list(zip(bounds, bounds)))
+    ingredients = fastio.ints(data2)
+    return intervals, ingredients
+
+
 def part1(intervals: list[Interval], ingredients: list[int]) -> int:
     return sum(
         any(start <= ingredient <= end for start, end in intervals)
@@ -31,12 +46,10 @@ def part1(intervals: list[Interval], ingredients: list[int]) -> int:
 
 
 def part2(intervals: list[Interval], ingredients: list[int]) -> int:
-    intervals.sort()
-
     total_length = 0
     last_end = -1
 
-    for start, end in intervals:
+    for start, end in sorted(intervals):
         start = max(start, last_end + 1)
         if start <= end:
             total_length += end - start + 1
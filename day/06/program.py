@@ -6,10 +6,17 @@ Author: kimerikal <kimerikal.games@gmail.com>
 import sys
 from collections.abc import Iterable
 from math import prod
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from aoclib import fastio  # noqa: E402
+
+PARTS_INDEPENDENT = True
 
 
 def main() -> int:
-    data = sys.stdin.read()
+    data = parse(fastio.read_input())
 
     print("Part 1:", part1(data))
     print("Part 2:", part2(data))
@@ -17,6 +24,10 @@ def main() -> int:
     return 0
 
 
+def parse(data: fastio.Buffer) -> str:
+    return fastio.text(data)
+
+
 def part1(data: str):
     lines = data.strip().split("\n")
 
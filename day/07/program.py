@@ -4,19 +4,20 @@ Author: kimerikal <kimerikal.games@gmail.com>
 """
 
 import sys
-from collections.abc import Sequence
+from pathlib import Path
 
-Grid = Sequence[Sequence[int]]
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from aoclib import fastio  # noqa: E402
+from aoclib.grid import Grid  # noqa: E402
+
+CELLS = bytes.maketrans(b".^S", b"\x00\x01\x09")
 
 
 def main() -> int:
-    data = sys.stdin.read().replace(".", "0").replace("^", "1").replace("S", "9")
-    lines = data.splitlines()[0::2]
-    grid = [list(map(int, line)) for line in lines]
-    rows = len(grid)
-    cols = len(grid[0])
+    grid = parse(fastio.read_input())
 
-    part1_answer, part2_answer = parts(rows, cols, grid)
+    part1_answer, part2_answer = parts(grid)
 
     print("Part 1:", part1_answer)
     print("Part 2:", part2_answer)
@@ -24,8 +25,13 @@ def main() -> int:
     return 0
 
 
-def parts(rows: int, cols: int, grid: Grid) -> tuple[int, int]:
-    start_col = grid[0].index(9)
+def parse(data: fastio.Buffer) -> Grid:
+    return Grid.from_text(data, CELLS)
+
+
+def parts(grid: Grid) -> tuple[int, int]:
+    cells, cols = grid.cells, grid.cols
+    start_col = cells.index(9, grid.index(0, 0)) - grid.index(0, 0)
 
     table: list[int] = [0] * cols
     beams: set[int] = set()
@@ -34,14 +40,15 @@ def parts(rows: int, cols: int, grid: Grid) -> tuple[int, int]:
     table[start_col] = 1
     beams.add(start_col)
 
-    for r in range(1, rows):
-        row = grid[r]
+    # Odd rows are empty
+    for r in range(2, grid.rows, 2):
+        row = grid.index(r, 0)
 
         next_beams: set[int] = set()
         next_table: list[int] = [0] * cols
 
         for beam in beams:
-            match row[beam]:
+            match cells[row + beam]:
                 case 0:
                     next_beams.add(beam)
                     next_table[beam] += table[beam]
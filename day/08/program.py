@@ -5,8 +5,13 @@ Author: kimerikal <kimerikal.games@gmail.com>
 
 import heapq
 import sys
+from pathlib import Path
 from typing import cast
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from aoclib import fastio  # noqa: E402
+
 Point = tuple[int, int, int]
 X, Y, Z = 0, 1, 2
 
@@ -40,10 +45,7 @@ class DisjointSet:
 
 
 def main() -> int:
-    junctions: list[Point] = [
-        cast(Point, tuple(map(int, line.split(","))))
-        for line in sys.stdin.readlines()
-    ]
+    junctions = parse(fastio.read_input())
 
     part1_answer, part2_answer = parts(junctions)
     print("Part 1:", part1_answer)
@@ -52,6 +54,11 @@ def main() -> int:
     return 0
 
 
+def parse(data: fastio.Buffer) -> list[Point]:
+    coordinates = fastio.iter_ints(data)
+    return cast(list[Point], list(zip(coordinates, coordinates, coordinates)))
+
+
 def parts(junctions: list[Point]) -> tuple[int, int]:
     # NOTE: connections_to_make is input-dependent.
     connections_to_make = 1000 if len(junctions) == 1000 else 10
@@ -4,20 +4,25 @@ Author: kimerikal <kimerikal.games@gmail.com>
 """
 
 import sys
+from pathlib import Path
 from typing import cast
 
-Grid = list[list[int]]
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from aoclib import fastio  # noqa: E402
+from aoclib.grid import Grid  # noqa: E402
+
 Point = tuple[int, int]
 Map = dict[int, int]
 
-FILL = -1
+EDGE = 1
+FILL = 2
+
+PARTS_INDEPENDENT = True
 
 
 def main() -> int:
-    points = [
-        cast(Point, tuple(map(int, line.split(","))))
-        for line in sys.stdin.readlines()
-    ]
+    points = parse(fastio.read_input())
 
     print("Part 1:", part1(points))
     print("Part 2:", part2(points))
@@ -25,6 +30,11 @@ def main() -> int:
     return 0
 
 
+def parse(data: fastio.Buffer) -> list[Point]:
+    coordinates = fastio.iter_ints(data)
+    return cast(list[Point], list(zip(coordinates, coordinates)))
+
+
 def part1(points: list[Point]) -> int:
     max_area = 0
 
@@ -51,7 +61,8 @@ def part2(points: list[Point]) -> int:
     ymap = {y: i for i, y in enumerate(yunique)}
 
     rows, cols = len(xmap), len(ymap)
-    grid = [[0] * cols for _ in range(rows)]
+    grid = Grid(rows, cols)
+    cells = grid.cells
 
     for i in range(len(points)):
         x1, y1 = points[i - 1]
@@ -61,12 +72,12 @@ def part2(points: list[Point]) -> int:
         cy1, cy2 = ymap[min(y1, y2)], ymap[max(y1, y2)]
 
         for x in range(cx1, cx2 + 1):
-            for y in range(cy1, cy2 + 1):
-                grid[x][y] = 1
+            row = grid.index(x, 0)
+            cells[row + cy1:row + cy2 + 1] = bytes([EDGE]) * (cy2 - cy1 + 1)
 
     for x, y in [(0, 0), (0, cols - 1), (rows - 1, 0), (rows - 1, cols - 1)]:
-        if grid[x][y] == 0:
-            flood_fill(rows, cols, grid, x, y)
+        if cells[grid.index(x, y)] == 0:
+            grid.flood_fill(grid.index(x, y), FILL)
 
     max_area = 0
 
@@ -78,7 +89,8 @@ def part2(points: list[Point]) -> int:
             cx1, cx2 = xmap[min(p1x, p2x)], xmap[max(p1x, p2x)]
             cy1, cy2 = ymap[min(p1y, p2y)], ymap[max(p1y, p2y)]
 
-            if any(grid[x][y] == FILL for x in (cx1, cx2) for y in range(cy1, cy2 + 1)):
+            row1, row2 = grid.index(cx1, 0), grid.index(cx2, 0)
+            if cells.find(FILL, row1 + cy1, row1 + cy2 + 1) >= 0 or cells.find(FILL, row2 + cy1, row2 + cy2 + 1) >= 0:
                 continue
 
             width = abs(p1x - p2x) + 1
@@ -91,20 +103,5 @@ def part2(points: list[Point]) -> int:
     return max_area
 
 
-def flood_fill(rows: int, cols: int, grid: Grid, x: int, y: int) -> None:
-    to_visit: list[Point] = []
-    to_visit.append((x, y))
-
-    while to_visit:
-        cx, cy = to_visit.pop()
-        if grid[cx][cy] != 0:
-            continue
-        grid[cx][cy] = FILL
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            nx, ny = cx + dx, cy + dy
-            if 0 <= nx < rows and 0 <= ny < cols and grid[nx][ny] == 0:
-                to_visit.append((nx, ny))
-
-
 if __name__ == "__main__":
     sys.exit(main())
@@ -4,21 +4,35 @@ Author: kimerikal <kimerikal.games@gmail.com>
 """
 
 import sys
+from pathlib import Path
 
 from ortools.sat.python import cp_model
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from aoclib import fastio  # noqa: E402
+
 State = list[int]
 Button = list[int]
 Affects = list[list[int]]
 Joltage = int
 Case = tuple[int, State, int, Affects, list[Joltage]]
 
+PARTS_INDEPENDENT = True
+
 
 def main() -> int:
-    lines = sys.stdin.readlines()
+    cases = parse(fastio.read_input())
+
+    print("Part 1:", part1(cases))
+    print("Part 2:", part2(cases))
+    return 0
+
+
+def parse(data: fastio.Buffer) -> list[Case]:
     cases: list[Case] = []
 
-    for line in lines:
+    for line in fastio.text(data).splitlines():
         parts = line.split()
 
         initial_state = list(map(int, parts[0][1:-1].replace(".", "0").replace("#", "1")))
@@ -34,9 +48,7 @@ def main() -> int:
 
         cases.append((num_lights, initial_state, num_buttons, affects, joltages))
 
-    print("Part 1:", part1(cases))
-    print("Part 2:", part2(cases))
-    return 0
+    return cases
 
 
 def part1(cases: list[Case]) -> int:
@@ -4,26 +4,38 @@ Author: kimerikal <kimerikal.games@gmail.com>
 """
 
 import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from aoclib import fastio  # noqa: E402
 
 Node = str
 Graph = dict[Node, list[Node]]
 
+PARTS_INDEPENDENT = True
+
 
 def main() -> int:
-    data = sys.stdin.readlines()
+    graph = parse(fastio.read_input())
+
+    print("Part 1:", part1(graph))
+    print("Part 2:", part2(graph))
+
+    return 0
+
+
+def parse(data: fastio.Buffer) -> Graph:
     graph: Graph = {}
 
-    for line in data:
+    for line in fastio.text(data).splitlines():
         args = line.split()
 
         source = args[0][:-1]
         destinations = args[1:]
         graph[source] = destinations
 
-    print("Part 1:", part1(graph))
-    print("Part 2:", part2(graph))
-
-    return 0
+    return graph
 
 
 def part1(graph: Graph) -> int:
@@ -4,32 +4,47 @@ Author: kimerikal <kimerikal.games@gmail.com>
 """
 
 import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from aoclib import fastio  # noqa: E402
 
 Shape = list[list[int]]
 Boardsize = tuple[int, int]
 Shapecount = list[int]
 Quantity = tuple[Boardsize, Shapecount]
 
+PARTS_INDEPENDENT = True
+
 
 def main() -> int:
+    shapes, quantities = parse(fastio.read_input())
+
+    print("Part 1:", part1(shapes, quantities))
+    print("Part 2:", part2(shapes, quantities))
+
+    return 0
+
+
+def parse(data: fastio.Buffer) -> tuple[list[Shape], list[Quantity]]:
     shapes: list[Shape] = []
     quantities: list[Quantity] = []
 
+    lines = iter(fastio.text(data).splitlines())
     parse_mode = "shapes"
-    while True:
-        line = sys.stdin.readline()
-
+    for line in lines:
         if parse_mode == "shapes" and "x" in line:
             parse_mode = "quantity"
 
         match parse_mode:
             case "shapes":
-                _ = line
+                if not line:
+                    continue
                 shape: Shape = []
                 for _ in range(3):
-                    shape.append([1 if c == "#" else 0 for c in sys.stdin.readline().strip()])
+                    shape.append([1 if c == "#" else 0 for c in next(lines).strip()])
                 shapes.append(shape)
-                _ = sys.stdin.readline()
             case "quantity":
                 if not line:
                     break
@@ -39,10 +54,7 @@ def main() -> int:
                 quantity = ((width, height), shapecounts)
                 quantities.append(quantity)
 
-    print("Part 1:", part1(shapes, quantities))
-    print("Part 2:", part2(shapes, quantities))
-
-    return 0
+    return shapes, quantities
 
 
 def part1(shapes: list[Shape], quantities: list[Quantity]) -> int:
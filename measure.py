@@ -1,47 +1,125 @@
+import argparse
+import functools
+import hashlib
+import json
+import math
 import pathlib
 import statistics
 import subprocess
+import sys
 import time
+from concurrent.futures import as_completed
 
 import pandas as pd
 from tqdm.auto import tqdm
 
-REPEATS = 5
+from bench import cache, complexity, generators, history, memory, scheduler, worker
+from bench.stats import SUMMARY_KEYS, SamplingPlan, outlier_mask, sample, summarize
+
+# Fresh process per run
+SAMPLING = SamplingPlan(warmup=1, min_repeats=5, max_repeats=30, ci_width=0.05)
+# Warm process, many runs per day
+IN_PROCESS_SAMPLING = SamplingPlan(warmup=3, min_repeats=10, max_repeats=200, ci_width=0.05)
+
+# Number of fresh processes timing a single cold run of each day
+COLD_RUNS = 3
+
+# Large inputs take long, so scaling runs sample less
+SCALE_SAMPLING = SamplingPlan(warmup=0, min_repeats=3, max_repeats=10, ci_width=0.05)
+
+# An environment is a uv Python request plus extra packages to install
+Environment = tuple[str, tuple[str, ...]]
 
 interpreters = [
-    ("Python 3.14", ["uv", "run", "--python", "cpython3.14"]),
-    ("PyPy 3.11", ["uv", "run", "--python", "pypy3.11"]),
+    ("Python 3.14", "cpython3.14"),
+    ("Python 3.14t", "cpython3.14t"),
+    ("PyPy 3.11", "pypy3.11"),
 ]
 
+# Environments that replace an interpreter for specific days
+day_environments: dict[tuple[int, str], Environment] = {
+    # OR-Tools has no wheels for Python 3.14 yet, nor for free-threaded builds
+    (10, "Python 3.14"): ("cpython3.13", ("ortools",)),
+    (10, "Python 3.14t"): ("cpython3.13", ("ortools",)),
+}
+
 
 # -------------------------------------------------------------------
 # Interpreter utilities
 # -------------------------------------------------------------------
-def print_interpreter_versions(interpreters_list: list[tuple[str, list[str]]]) -> None:
-    print("Interpreters:")
-    for name, cmd in interpreters_list:
+# Persistent environments for days that need extra packages
+ENVS_DIR = pathlib.Path(".bench") / "envs"
+
+
+@functools.cache
+def resolve_environment(environment: Environment) -> str:
+    """
+    Resolve an environment with uv once and return its Python executable.
+
+    Measured programs are started with this path directly, so uv's
+    environment resolution is not part of the timings. Environments with
+    packages get a virtual environment in ENVS_DIR, named by a hash of the
+    environment and created on first use, because the ones `uv run --with`
+    creates are deleted when it exits.
+    """
+    python, packages = environment
+    if not packages:
         out = subprocess.run(
-            cmd + ["python", "--version"],
+            ["uv", "run", "--python", python, "python", "-c", "import sys; print(sys.executable)"],
             check=True,
             capture_output=True,
             text=True,
         )
-        print("-", name)
-        print(out.stdout.strip())
+        return out.stdout.strip()
+
+    env_path = (ENVS_DIR / hashlib.sha256(repr(environment).encode()).hexdigest()[:16]).resolve()
+    executable = env_path / "bin" / "python"
+    # Written last, so a half-built environment is built again
+    ready_path = env_path / ".ready"
+    if not ready_path.exists():
+        subprocess.run(["uv", "venv", "--clear", "--python", python, str(env_path)], check=True, capture_output=True)
+        subprocess.run(
+            ["uv", "pip", "install", "--python", str(executable), *packages],
+            check=True,
+            capture_output=True,
+        )
+        ready_path.write_text(repr(environment) + "\n")
+    return str(executable)
+
+
+def interpreter_command(day: int, name: str, python: str) -> list[str]:
+    """Return the command that runs Python for a day with the named interpreter."""
+    environment = day_environments.get((day, name), (python, ()))
+    return [resolve_environment(environment)]
+
+
+@functools.cache
+def get_interpreter_version(cmd: tuple[str, ...]) -> str:
+    """Return the one-line `python --version` output of an interpreter command."""
+    out = subprocess.run(
+        list(cmd) + ["--version"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return out.stdout.replace("\n", " ").strip()
+
+
+def print_interpreter_versions(interpreters_list: list[tuple[str, str]]) -> None:
+    print("Interpreters:")
+    for name, python in interpreters_list:
+        cmd = [resolve_environment((python, ()))]
+        print("-", name, f"({cmd[0]})")
+        print(get_interpreter_version(tuple(cmd)))
     print()
 
 
-def get_interpreter_markdown(interpreters_list: list[tuple[str, list[str]]]) -> str:
+def get_interpreter_markdown(interpreters_list: list[tuple[str, str]]) -> str:
     """Return a markdown bullet list with interpreter versions."""
     md = ""
-    for name, cmd in interpreters_list:
-        out = subprocess.run(
-            cmd + ["python", "--version"],
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        md += f"- {name}: {out.stdout.replace('\n', ' ').strip()}\n"
+    for name, python in interpreters_list:
+        cmd = [resolve_environment((python, ()))]
+        md += f"- {name}: {get_interpreter_version(tuple(cmd))}\n"
     md += "\n"
     return md
 
@@ -49,141 +127,799 @@ def get_interpreter_markdown(interpreters_list: list[tuple[str, list[str]]]) ->
 # -------------------------------------------------------------------
 # Measurement core
 # -------------------------------------------------------------------
+RUSAGE_COLUMNS = {
+    "wall_s": "Time [s]",
+    "user_s": "User [s]",
+    "system_s": "System [s]",
+    "maxrss_kb": "Memory [KB]",
+    "minflt": "Minor Faults",
+    "majflt": "Major Faults",
+    "nvcsw": "Vol. CS",
+    "nivcsw": "Invol. CS",
+}
+
+TIME_STAT_COLUMNS = {
+    "min": "Time Min [s]",
+    "p95": "Time P95 [s]",
+    "stddev": "Time Std [s]",
+    "runs": "Runs",
+}
+
+LAUNCHER = pathlib.Path(__file__).resolve().parent / "bench" / "launch.py"
+
+# Printed to stdout but left out of the README table
+DETAIL_COLUMNS = (
+    "User [s]", "System [s]", "Minor Faults", "Major Faults", "Vol. CS", "Invol. CS",
+    "Min [s]", "P95 [s]", "Std [s]", "Min [ms]", "P95 [ms]", "Std [ms]", "Runs", "Peak RSS [KB]",
+)
+
+
+def run_with_rusage(cmd: list[str], stdin_f) -> tuple[int, dict[str, float]]:
+    """
+    Run a command to completion and collect its resource usage with os.wait4.
+
+    Returns (exit code, usage) where usage has the keys of RUSAGE_COLUMNS.
+    The child is started by bench/launch.py so that its max RSS is not
+    inflated by this process, and its stdout and stderr are discarded.
+    Raises RuntimeError if the launcher itself fails, e.g. when the
+    interpreter does not exist.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-S", str(LAUNCHER)] + cmd,
+        stdin=stdin_f,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"launcher failed: {proc.stderr.strip()}")
+    usage = json.loads(proc.stdout)
+    returncode = usage.pop("returncode")
+    return returncode, usage
+
+
+def summarize_runs(runs: list[dict[str, float]]) -> dict[str, float]:
+    """
+    Reduce per-run usage to one value per column.
+
+    Runs whose wall time is an outlier are dropped. Every RUSAGE_COLUMNS key
+    becomes the median over the remaining runs, and the wall time statistics
+    are added under the keys of SUMMARY_KEYS.
+    """
+    keep = outlier_mask([run["wall_s"] for run in runs])
+    kept = [run for run, k in zip(runs, keep) if k]
+
+    summary = {key: statistics.median(run[key] for run in kept) for key in RUSAGE_COLUMNS}
+    summary |= summarize([run["wall_s"] for run in kept])
+    return summary
+
+
 def measure_interpreter_on_day(
-    day: int,
     day_path: pathlib.Path,
-    name: str,
     cmd: list[str],
-    repeats: int,
-    pbar: tqdm,
-) -> tuple[bool, float | None, float | None]:
+    plan: SamplingPlan,
+    in_path: pathlib.Path | None = None,
+) -> tuple[bool, dict[str, float] | None]:
     """
-    Run a day's program with a given interpreter multiple times.
+    Run a day's program with a given interpreter until the timings are stable.
 
-    Returns (ok, avg_time_ms, avg_memory_kb).
-    If ok is False, averages are None.
+    The input is the day's in.txt unless `in_path` is given.
+    Returns (ok, summary) where summary is produced by summarize_runs.
+    If ok is False, summary is None.
     """
-    times_s: list[float] = []
-    memories_kb: list[float] = []
-
     # Use a single opened stdin file per interpreter/day
-    in_path = day_path / "in.txt"
+    in_path = in_path or day_path / "in.txt"
     with in_path.open("r") as stdin_f:
-        for i in range(repeats):
-            pbar.set_description_str(f"Day {day:02d} {name:>8s} {i+1}/{repeats}")
-            pbar.update()
-
-            if "cpython3.14" in cmd and day == 10:
-                cmd = ["uv", "run", "--with", "ortools", "--python", "cpython3.13"]
 
+        def run() -> dict[str, float]:
             stdin_f.seek(0)
-            proc = subprocess.run(
-                ["/usr/bin/time", "-f", "%e %M"] + cmd + [str(day_path / "program.py")],
-                stdin=stdin_f,
-                capture_output=True,
-                text=True,
+            returncode, usage = run_with_rusage(
+                cmd + [str(day_path / "program.py")],
+                stdin_f,
             )
+            if returncode != 0:
+                raise RuntimeError(f"exit code {returncode}")
+            return usage
+
+        try:
+            runs = sample(run, lambda usage: usage["wall_s"], plan)
+        except RuntimeError:
+            return False, None
+
+    return True, summarize_runs(runs)
+
+
+def count_code(day_path: pathlib.Path) -> dict[str, int]:
+    """Count lines, words and bytes of a day's program."""
+    wc = subprocess.run(
+        ["wc", str(day_path / "program.py")],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    lines, words, chars = map(int, wc.stdout.split()[:3])
+    return {"Lines": lines, "Words": words, "Bytes": chars}
+
+
+def collect_measurements(
+    root: pathlib.Path,
+    interpreters_list: list[tuple[str, str]],
+    plan: SamplingPlan,
+    force: bool = False,
+    jobs: int = 1,
+    reserve_cores: int = 0,
+) -> tuple[pd.DataFrame, list[dict]]:
+    """
+    Walk all day directories, run measurements, return a DataFrame and history records.
+
+    Each (day, interpreter) pair is one job. Cached results are reused unless
+    `force` is set, and the remaining jobs run on up to `jobs` pinned cores.
+    """
+    paths = sorted((root / "day").iterdir())
+    # Only count numeric, non-zero day dirs in progress total
+    day_paths = [p for p in paths if p.name.isdigit() and int(p.name) > 0]
+
+    summaries: dict[tuple[int, str], dict[str, float] | None] = {}
+    versions: dict[tuple[int, str], str] = {}
+    pending: list[tuple[int, pathlib.Path, str, list[str], str]] = []
+
+    for day_path in day_paths:
+        day = int(day_path.name)
+        for name, python in interpreters_list:
+            cmd = interpreter_command(day, name, python)
+            version = get_interpreter_version(tuple(cmd))
+            key = cache.cache_key(day_path, "process", (name, tuple(cmd), version), tuple(plan))
+
+            versions[day, name] = version
+            summary = None if force else cache.load(root, key)
+            if summary is not None:
+                summaries[day, name] = summary
+            else:
+                pending.append((day, day_path, name, cmd, key))
 
-            if proc.returncode != 0:
+    with (
+        tqdm(
+            total=len(day_paths) * len(interpreters_list),
+            initial=len(summaries),
+            bar_format="{l_bar}|{bar}| {n_fmt}/{total_fmt}{postfix}",
+        ) as pbar,
+        scheduler.pinned_pool(jobs, reserve_cores) as pool,
+    ):
+        futures = {
+            pool.submit(measure_interpreter_on_day, day_path, cmd, plan): (day, name, key)
+            for day, day_path, name, cmd, key in pending
+        }
+        for future in as_completed(futures):
+            day, name, key = futures[future]
+            ok, summary = future.result()
+
+            pbar.set_description_str(f"Day {day:02d} {name:>8s}")
+            pbar.update()
+
+            if ok:
+                cache.store(root, key, summary)
+            else:
                 print(f"Day {day:02d} {name} failed")
-                return False, None, None
+            summaries[day, name] = summary
 
-            parts = proc.stderr.split()
-            if len(parts) < 2:
-                print(f"Day {day:02d} {name} produced unexpected time output")
-                return False, None, None
+    results: list[dict] = []
+    records: list[dict] = []
 
-            real_s = float(parts[0])
-            mem_kb = float(parts[1])
+    for day_path in day_paths:
+        day = int(day_path.name)
+        result: dict[str, float | None] = {"Day": day} | count_code(day_path)
 
-            runtime_s = real_s
+        for name, _ in interpreters_list:
+            summary = summaries[day, name]
+            for key, column in (RUSAGE_COLUMNS | TIME_STAT_COLUMNS).items():
+                result[f"{name} {column}"] = summary[key] if summary is not None else None
 
-            times_s.append(runtime_s)
-            memories_kb.append(mem_kb)
+            if summary is not None:
+                records.append(history.make_record(
+                    root=root,
+                    mode="process",
+                    day=day,
+                    interpreter=name,
+                    interpreter_version=versions[day, name],
+                    time_stats={key: summary[key] for key in SUMMARY_KEYS},
+                    memory_kb=summary["maxrss_kb"],
+                ))
 
-    avg_time_s = statistics.fmean(times_s)
-    avg_memory_kb = statistics.fmean(memories_kb)
-    return True, avg_time_s, avg_memory_kb
+        results.append(result)
 
+    if not results:
+        return pd.DataFrame(), records
 
-def measure_day(
-    day_path: pathlib.Path,
-    interpreters_list: list[tuple[str, list[str]]],
-    repeats: int,
-    pbar: tqdm,
-) -> dict | None:
+    df = pd.DataFrame(results).set_index("Day").sort_index()
+    return df, records
+
+
+# -------------------------------------------------------------------
+# In-process measurement
+# -------------------------------------------------------------------
+PHASE_LABELS = {
+    "parse": "Parse",
+    "part1": "Part 1",
+    "part2": "Part 2",
+    "parts": "Parts",
+}
+
+
+def run_worker(
+    root: pathlib.Path,
+    cmd: list[str],
+    days: list[int],
+    plan: SamplingPlan,
+    in_path: pathlib.Path | None = None,
+    concurrent_parts: bool = False,
+) -> dict[int, dict]:
     """
-    Measure one day for all interpreters.
+    Start one bench.worker process and let it time the given days.
 
-    Returns a result dict if all interpreters succeed,
-    otherwise returns None.
+    The days read `in_path` instead of their in.txt if it is given.
+    With `concurrent_parts`, independent parts run on two threads.
+    Returns a mapping from day to the worker's JSON result.
     """
-    day_name = day_path.name
-    if not day_name.isdigit():
-        return None
+    proc = subprocess.run(
+        cmd
+        + ["-m", "bench.worker", str(root)]
+        + [str(day) for day in days]
+        + [
+            f"--warmup={plan.warmup}",
+            f"--min-repeats={plan.min_repeats}",
+            f"--max-repeats={plan.max_repeats}",
+            f"--ci-width={plan.ci_width}",
+        ]
+        + ([f"--input={in_path}"] if in_path is not None else [])
+        + (["--concurrent-parts"] if concurrent_parts else []),
+        cwd=root,
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+    )
 
-    day = int(day_name)
-    if day == 0:
-        return None
+    results: dict[int, dict] = {}
+    for line in proc.stdout.splitlines():
+        result = json.loads(line)
+        results[result["day"]] = result
 
-    result: dict[str, float | None] = {"Day": day}
+    # A worker that crashed outright reports nothing for its days
+    for day in days:
+        results.setdefault(day, {"day": day, "ok": False, "error": proc.stderr.strip() or "no result"})
 
-    # Count lines, words, bytes
-    wc = subprocess.run(
-        ["wc", str(day_path / "program.py")],
-        check=True,
+    return results
+
+
+def run_cold(
+    root: pathlib.Path,
+    cmd: list[str],
+    day: int,
+    concurrent_parts: bool = False,
+) -> list[dict[str, int]] | None:
+    """Time the first run of a day in COLD_RUNS fresh workers. Returns None on failure."""
+    plan = SamplingPlan(warmup=0, min_repeats=1, max_repeats=1, ci_width=0.0)
+    runs: list[dict[str, int]] = []
+    for _ in range(COLD_RUNS):
+        result = run_worker(root, cmd, [day], plan, concurrent_parts=concurrent_parts)[day]
+        if not result["ok"]:
+            return None
+        runs += result["runs"]
+    return runs
+
+
+def measure_in_process(
+    root: pathlib.Path,
+    cmd: list[str],
+    days: list[int],
+    plan: SamplingPlan,
+    concurrent_parts: bool = False,
+) -> dict[int, dict]:
+    """Run the warm worker for the given days, then add cold runs under "cold_runs"."""
+    results = run_worker(root, cmd, days, plan, concurrent_parts=concurrent_parts)
+    for day, result in results.items():
+        if result["ok"]:
+            result["cold_runs"] = run_cold(root, cmd, day, concurrent_parts)
+    return results
+
+
+def summarize_phases(
+    name: str,
+    runs: list[dict[str, int]],
+    cold_runs: list[dict[str, int]] | None = None,
+) -> tuple[dict[str, float], dict[str, float]]:
+    """
+    Turn worker runs (ns per phase) into DataFrame columns in milliseconds.
+
+    With cold_runs, the median total of the warm runs and of the cold runs
+    follow the phases. Returns (columns, total_stats) where total_stats
+    summarizes the total time per warm run in seconds.
+    """
+    totals = [sum(run.values()) / 1e9 for run in runs]
+    keep = outlier_mask(totals)
+    kept = [run for run, k in zip(runs, keep) if k]
+
+    columns: dict[str, float] = {}
+    for phase in kept[0]:
+        median_ms = statistics.median(run[phase] for run in kept) / 1e6
+        columns[f"{name} {PHASE_LABELS[phase]} [ms]"] = median_ms
+
+    total_stats = summarize([total for total, k in zip(totals, keep) if k])
+    if cold_runs:
+        columns[f"{name} Warm [ms]"] = total_stats["median"] * 1e3
+        columns[f"{name} Cold [ms]"] = statistics.median(sum(run.values()) for run in cold_runs) / 1e6
+    columns[f"{name} Total Min [ms]"] = total_stats["min"] * 1e3
+    columns[f"{name} Total P95 [ms]"] = total_stats["p95"] * 1e3
+    columns[f"{name} Total Std [ms]"] = total_stats["stddev"] * 1e3
+    columns[f"{name} Runs"] = total_stats["runs"]
+    return columns, total_stats
+
+
+def collect_in_process_measurements(
+    root: pathlib.Path,
+    interpreters_list: list[tuple[str, str]],
+    plan: SamplingPlan,
+    force: bool = False,
+    jobs: int = 1,
+    reserve_cores: int = 0,
+    concurrent_parts: bool = False,
+) -> tuple[pd.DataFrame, list[dict]]:
+    """
+    Time parse and parts of every day inside warm worker processes.
+
+    Columns hold the median time of each phase in milliseconds. Runs whose
+    total time is an outlier are dropped first, and min/p95/stddev of the
+    total are added as extra columns. History records are returned as well.
+    Days with a cached result are not measured again unless `force` is set.
+
+    "Warm" is the median total after the sampling plan's warmup runs, and
+    "Cold" the median total of the first run in COLD_RUNS fresh processes,
+    which includes JIT warmup but not interpreter startup.
+
+    With one job, each interpreter gets a single worker for all its days.
+    With more, every day gets its own worker so days can run side by side.
+
+    With `concurrent_parts`, days that set PARTS_INDEPENDENT run part1 and
+    part2 on two threads and report them together as "Parts". Each worker is
+    then pinned to two cores, so jobs get fewer workers. These results are
+    cached and recorded under their own mode.
+    """
+    mode = "in-process-concurrent" if concurrent_parts else "in-process"
+    paths = sorted((root / "day").iterdir())
+    days = [int(p.name) for p in paths if p.name.isdigit() and int(p.name) > 0]
+
+    results: dict[tuple[int, str], dict] = {}
+    versions: dict[tuple[int, str], str] = {}
+    keys: dict[tuple[int, str], str] = {}
+    pending: list[tuple[str, tuple[str, ...], list[int]]] = []
+
+    for name, python in interpreters_list:
+        # Days that need a different environment get their own worker
+        groups: dict[tuple[str, ...], list[int]] = {}
+        for day in days:
+            groups.setdefault(tuple(interpreter_command(day, name, python)), []).append(day)
+
+        for group_cmd, group_days in groups.items():
+            version = get_interpreter_version(group_cmd)
+            identity = (name, group_cmd, version)
+            to_measure: list[int] = []
+
+            for day in group_days:
+                key = cache.cache_key(root / "day" / f"{day:02d}", mode, identity, tuple(plan))
+                versions[day, name] = version
+                keys[day, name] = key
+
+                cached = None if force else cache.load(root, key)
+                if cached is not None:
+                    results[day, name] = cached
+                else:
+                    to_measure.append(day)
+
+            if not to_measure:
+                continue
+            if jobs == 1:
+                pending.append((name, group_cmd, to_measure))
+            else:
+                pending.extend((name, group_cmd, [day]) for day in to_measure)
+
+    with (
+        tqdm(
+            total=len(days) * len(interpreters_list),
+            initial=len(results),
+            bar_format="{l_bar}|{bar}| {n_fmt}/{total_fmt}{postfix}",
+        ) as pbar,
+        # Concurrent parts need a core per thread to run in parallel
+        scheduler.pinned_pool(jobs, reserve_cores, worker.PARTS_THREADS if concurrent_parts else 1) as pool,
+    ):
+        futures = {
+            pool.submit(measure_in_process, root, list(group_cmd), job_days, plan, concurrent_parts): name
+            for name, group_cmd, job_days in pending
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            for day, result in future.result().items():
+                pbar.set_description_str(f"Day {day:02d} {name:>8s}")
+                pbar.update()
+
+                if result["ok"]:
+                    cache.store(root, keys[day, name], result)
+                else:
+                    print(f"Day {day:02d} {name} failed: {result['error']}")
+                results[day, name] = result
+
+    rows: dict[int, dict[str, float]] = {day: {"Day": day} for day in days}
+    records: list[dict] = []
+
+    for (day, name), result in sorted(results.items()):
+        if not result["ok"]:
+            continue
+        columns, total_stats = summarize_phases(name, result["runs"], result.get("cold_runs"))
+        rows[day].update(columns)
+        records.append(history.make_record(
+            root=root,
+            mode=mode,
+            day=day,
+            interpreter=name,
+            interpreter_version=versions[day, name],
+            time_stats=total_stats,
+            memory_kb=None,
+        ))
+
+    df = pd.DataFrame(list(rows.values())).set_index("Day").sort_index()
+
+    # Group columns by interpreter, phases in order
+    suffixes = [f"{label} [ms]" for label in PHASE_LABELS.values()] + [
+        "Warm [ms]", "Cold [ms]", "Total Min [ms]", "Total P95 [ms]", "Total Std [ms]", "Runs",
+    ]
+    order = [f"{name} {suffix}" for name, _ in interpreters_list for suffix in suffixes]
+    return df[[col for col in order if col in df.columns]], records
+
+
+# -------------------------------------------------------------------
+# Memory
+# -------------------------------------------------------------------
+MEMORY_DIR = pathlib.Path(".bench") / "memory"
+
+# Seconds between two RSS samples
+RSS_INTERVAL = 0.005
+
+
+def run_memory_tracer(
+    root: pathlib.Path,
+    cmd: list[str],
+    day: int,
+    top: int,
+    in_path: pathlib.Path | None = None,
+) -> dict | None:
+    """Run bench.memory on a day. Returns its JSON result, or None if it failed."""
+    proc = subprocess.run(
+        cmd
+        + ["-m", "bench.memory", str(root), str(day), f"--top={top}"]
+        + ([f"--input={in_path}"] if in_path is not None else []),
+        cwd=root,
+        stdin=subprocess.DEVNULL,
         capture_output=True,
         text=True,
     )
-    lines, words, chars = map(int, wc.stdout.split()[:3])
-    result["Lines"] = lines
-    result["Words"] = words
-    result["Bytes"] = chars
+    if proc.returncode != 0:
+        return None
+    traced = json.loads(proc.stdout)
+    return traced if traced["ok"] else None
 
-    # Measure for each interpreter
-    for name, cmd in interpreters_list:
-        ok, avg_time_s, avg_mem_kb = measure_interpreter_on_day(
-            day=day,
-            day_path=day_path,
-            name=name,
-            cmd=cmd,
-            repeats=repeats,
-            pbar=pbar,
-        )
 
-        result[f"{name} Time [s]"] = avg_time_s
-        result[f"{name} Memory [KB]"] = avg_mem_kb
+def measure_memory_on_day(root: pathlib.Path, day: int, name: str, cmd: list[str], top: int) -> dict | None:
+    """
+    Sample the RSS of a plain run and trace the allocations of each phase.
 
-    return result
+    The RSS timeline and the top allocation sites are written to
+    .bench/memory/dayNN/. Returns None if either run fails.
+    """
+    day_path = root / "day" / f"{day:02d}"
+    with open(day_path / "in.txt") as stdin_f:
+        returncode, peak_rss_kb, timeline = memory.sample_rss(cmd + [str(day_path / "program.py")], stdin_f, RSS_INTERVAL)
+    if returncode != 0:
+        return None
 
+    traced = run_memory_tracer(root, cmd, day, top)
+    if traced is None:
+        return None
 
-def collect_measurements(
+    out_dir = root / MEMORY_DIR / f"day{day:02d}"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    slug = name.lower().replace(" ", "-").replace(".", "")
+
+    with open(out_dir / f"{slug}-rss.csv", "w") as f:
+        f.write("seconds,rss_kb\n")
+        for seconds, rss_kb in timeline:
+            f.write(f"{seconds:.4f},{rss_kb}\n")
+
+    lines = [f"Day {day:02d} {name}: peak RSS {peak_rss_kb} KB"]
+    for phase, report in traced["phases"].items():
+        if report is None:
+            lines.append(f"{PHASE_LABELS[phase]}: tracemalloc not available")
+            continue
+        lines.append(f"{PHASE_LABELS[phase]}: peak traced {report['peak_kb']:.1f} KB")
+        for site, size_kb, count in report["top"]:
+            lines.append(f"  {size_kb:10.1f} KB {count:8d} blocks  {site}")
+    (out_dir / f"{slug}.txt").write_text("\n".join(lines) + "\n")
+
+    return {"peak_rss_kb": peak_rss_kb, "phases": traced["phases"]}
+
+
+def collect_memory_measurements(
     root: pathlib.Path,
-    interpreters_list: list[tuple[str, list[str]]],
-    repeats: int,
+    interpreters_list: list[tuple[str, str]],
+    jobs: int = 1,
+    reserve_cores: int = 0,
+    top: int = 10,
 ) -> pd.DataFrame:
-    """Walk all day directories, run measurements, return a DataFrame."""
+    """
+    Measure the peak RSS and the peak traced memory of each phase in KB.
+
+    Phase columns are empty on interpreters without tracemalloc.
+    """
     paths = sorted((root / "day").iterdir())
-    # Only count numeric, non-zero day dirs in progress total
-    day_paths = [p for p in paths if p.name.isdigit() and int(p.name) > 0]
-    pbar_total = len(day_paths) * len(interpreters_list) * repeats
+    days = [int(p.name) for p in paths if p.name.isdigit() and int(p.name) > 0]
 
-    results: list[dict] = []
+    rows: dict[int, dict[str, float]] = {day: {"Day": day} for day in days}
+
+    with (
+        tqdm(total=len(days) * len(interpreters_list), bar_format="{l_bar}|{bar}| {n_fmt}/{total_fmt}{postfix}") as pbar,
+        scheduler.pinned_pool(jobs, reserve_cores) as pool,
+    ):
+        futures = {
+            pool.submit(measure_memory_on_day, root, day, name, interpreter_command(day, name, python), top): (day, name)
+            for name, python in interpreters_list
+            for day in days
+        }
+        for future in as_completed(futures):
+            day, name = futures[future]
+            pbar.set_description_str(f"Day {day:02d} {name:>8s}")
+            pbar.update()
 
-    with tqdm(
-        total=pbar_total,
-        bar_format="{l_bar}|{bar}| {n_fmt}/{total_fmt}{postfix}",
-    ) as pbar:
-        for day_path in day_paths:
-            result = measure_day(day_path, interpreters_list, repeats, pbar)
-            if result is not None:
-                results.append(result)
+            result = future.result()
+            if result is None:
+                print(f"Day {day:02d} {name} failed")
+                continue
 
-    if not results:
+            rows[day][f"{name} Peak RSS [KB]"] = result["peak_rss_kb"]
+            for phase, report in result["phases"].items():
+                if report is not None:
+                    rows[day][f"{name} {PHASE_LABELS[phase]} Peak [KB]"] = report["peak_kb"]
+
+    df = pd.DataFrame(list(rows.values())).set_index("Day").sort_index()
+
+    # Group columns by interpreter, phases in order
+    suffixes = ["Peak RSS [KB]"] + [f"{label} Peak [KB]" for label in PHASE_LABELS.values()]
+    order = [f"{name} {suffix}" for name, _ in interpreters_list for suffix in suffixes]
+    return df[[col for col in order if col in df.columns]]
+
+
+# -------------------------------------------------------------------
+# Scaling
+# -------------------------------------------------------------------
+SCALE_DIR = pathlib.Path(".bench") / "scale"
+
+# Stop climbing a ladder once a size takes, or would take, longer than this many seconds
+SCALE_BUDGET = 10.0
+
+
+def scale_input(root: pathlib.Path, day: int, n: int, seed: int) -> pathlib.Path:
+    """Write the generated input for a day and size once and return its path."""
+    path = root / SCALE_DIR / f"day{day:02d}" / f"n{n}-seed{seed}.txt"
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(generators.generate(day, n, seed))
+        tmp.rename(path)
+    return path
+
+
+def measure_ladder(
+    root: pathlib.Path,
+    day: int,
+    name: str,
+    cmd: list[str],
+    inputs: list[tuple[int, pathlib.Path]],
+    plan: SamplingPlan,
+) -> list[tuple[int, dict[str, float]]]:
+    """
+    Measure a day on inputs of growing size.
+
+    Every size is run as a process for time and max RSS, in a worker for
+    the time of each phase, and under bench.memory for the peak traced
+    memory of each phase. Returns (n, columns) per size. Stops at the first
+    failure or once a size is slower than SCALE_BUDGET, so a blow-up does
+    not stall the whole run.
+    """
+    day_path = root / "day" / f"{day:02d}"
+    results: list[tuple[int, dict[str, float]]] = []
+
+    for n, in_path in inputs:
+        ok, summary = measure_interpreter_on_day(day_path, cmd, plan, in_path)
+        worker_result = run_worker(root, cmd, [day], plan, in_path)[day]
+        traced = run_memory_tracer(root, cmd, day, 0, in_path)
+        if not ok or not worker_result["ok"] or traced is None:
+            break
+
+        columns = {f"{name} Time [s]": summary["wall_s"], f"{name} Memory [KB]": summary["maxrss_kb"]}
+        phase_columns, _ = summarize_phases(name, worker_result["runs"])
+        columns |= {col: value for col, value in phase_columns.items() if not col.endswith(DETAIL_COLUMNS)}
+        for phase, report in traced["phases"].items():
+            if report is not None:
+                columns[f"{name} {PHASE_LABELS[phase]} Peak [KB]"] = report["peak_kb"]
+        results.append((n, columns))
+
+        if summary["wall_s"] > SCALE_BUDGET or projected_time(results, inputs, name) > SCALE_BUDGET:
+            break
+
+    return results
+
+
+def projected_time(results: list[tuple[int, dict[str, float]]], inputs: list[tuple[int, pathlib.Path]], name: str) -> float:
+    """Extrapolate the time of the next size from the growth between the last two."""
+    if len(results) < 2 or len(results) == len(inputs):
+        return 0.0
+    (n0, columns0), (n1, columns1) = results[-2:]
+    t0, t1 = columns0[f"{name} Time [s]"], columns1[f"{name} Time [s]"]
+    exponent = max(0.0, math.log(t1 / t0) / math.log(n1 / n0))
+    return t1 * (inputs[len(results)][0] / n1) ** exponent
+
+
+def collect_scale_measurements(
+    root: pathlib.Path,
+    interpreters_list: list[tuple[str, str]],
+    days: list[int],
+    sizes: list[int] | None,
+    plan: SamplingPlan,
+    seed: int = 0,
+    jobs: int = 1,
+    reserve_cores: int = 0,
+) -> pd.DataFrame:
+    """
+    Run days on generated inputs of growing size n.
+
+    Each day climbs the ladder of bench.generators, or `sizes` if given.
+    All days with a generator are run if `days` is empty. The DataFrame is
+    indexed by (Day, n); sizes a day did not reach are left empty.
+    """
+    days = days or [
+        day for day in generators.GENERATORS if (root / "day" / f"{day:02d}" / "program.py").exists()
+    ]
+
+    inputs: dict[int, list[tuple[int, pathlib.Path]]] = {}
+    for day in days:
+        ladder = sizes or generators.GENERATORS[day].ladder
+        inputs[day] = [(n, scale_input(root, day, n, seed)) for n in ladder]
+
+    rows: dict[tuple[int, int], dict[str, float | str]] = {
+        (day, n): {"Day": day, "n": n, "Unit": generators.GENERATORS[day].unit}
+        for day in days
+        for n, _ in inputs[day]
+    }
+
+    with (
+        tqdm(total=len(days) * len(interpreters_list), bar_format="{l_bar}|{bar}| {n_fmt}/{total_fmt}{postfix}") as pbar,
+        scheduler.pinned_pool(jobs, reserve_cores) as pool,
+    ):
+        futures = {
+            pool.submit(
+                measure_ladder, root, day, name, interpreter_command(day, name, python), inputs[day], plan
+            ): (day, name)
+            for day in days
+            for name, python in interpreters_list
+        }
+        for future in as_completed(futures):
+            day, name = futures[future]
+            pbar.set_description_str(f"Day {day:02d} {name:>8s}")
+            pbar.update()
+
+            results = future.result()
+            if len(results) < len(inputs[day]):
+                print(f"Day {day:02d} {name} stopped after n={results[-1][0] if results else '-'}")
+
+            for n, columns in results:
+                rows[day, n].update(columns)
+
+    return pd.DataFrame(list(rows.values())).set_index(["Day", "n"]).sort_index()
+
+
+def fit_complexity(df: pd.DataFrame, interpreters_list: list[tuple[str, str]]) -> pd.DataFrame:
+    """
+    Fit every measured column of a scaling DataFrame against n.
+
+    Returns one row per (Day, Interpreter, Measure) with the log-log
+    exponent, its R², and the best of the candidate models with its R².
+    """
+    rows: list[dict] = []
+    for day, day_df in df.groupby(level="Day"):
+        ns = list(day_df.index.get_level_values("n"))
+        for name, _ in interpreters_list:
+            for col in day_df.columns:
+                if not col.startswith(f"{name} "):
+                    continue
+                result = complexity.fit(ns, list(day_df[col]))
+                if result is None:
+                    continue
+                rows.append({
+                    "Day": day,
+                    "Interpreter": name,
+                    "Measure": col.removeprefix(f"{name} "),
+                    "Exponent": result.exponent,
+                    "R²": result.r2,
+                    "Model": result.model,
+                    "Model R²": result.model_r2,
+                })
+
+    if not rows:
         return pd.DataFrame()
+    return pd.DataFrame(rows).set_index(["Day", "Interpreter", "Measure"])
 
-    df = pd.DataFrame(results).set_index("Day").sort_index()
-    return df
+
+def make_fit_records(
+    root: pathlib.Path,
+    fits: pd.DataFrame,
+    interpreters_list: list[tuple[str, str]],
+    seed: int,
+) -> list[dict]:
+    """One history record of fits per day and interpreter."""
+    if fits.empty:
+        return []
+
+    pythons = dict(interpreters_list)
+    records: list[dict] = []
+    for (day, name), group in fits.groupby(level=["Day", "Interpreter"]):
+        version = get_interpreter_version(tuple(interpreter_command(day, name, pythons[name])))
+        measures = {
+            measure: {"exponent": row["Exponent"], "r2": row["R²"], "model": row["Model"]}
+            for (_, _, measure), row in group.iterrows()
+        }
+        records.append(history.make_fit_record(root, day, name, version, seed, measures))
+    return records
+
+
+# -------------------------------------------------------------------
+# Profiling
+# -------------------------------------------------------------------
+PROFILE_DIR = pathlib.Path(".bench") / "profile"
+
+
+def profile_day(
+    root: pathlib.Path,
+    day: int,
+    interpreters_list: list[tuple[str, str]],
+    backend: str,
+    top: int,
+) -> None:
+    """
+    Profile a day's main() with every interpreter and print the hot functions.
+
+    Output files go to .bench/profile/dayNN/, one set per interpreter.
+    """
+    out_dir = root / PROFILE_DIR / f"day{day:02d}"
+
+    for name, python in interpreters_list:
+        cmd = interpreter_command(day, name, python)
+        slug = name.lower().replace(" ", "-").replace(".", "")
+        out_prefix = out_dir / f"{slug}-{backend}"
+
+        proc = subprocess.run(
+            cmd + ["-m", "bench.profiler", str(root), str(day), str(out_prefix), f"--backend={backend}", f"--top={top}"],
+            cwd=root,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+        )
+
+        print(f"=== Day {day:02d} {name} ({backend}) ===")
+        if proc.returncode != 0:
+            print(f"Profiling failed:\n{proc.stderr}")
+            continue
+
+        print(out_prefix.with_name(out_prefix.name + ".txt").read_text())
+        for suffix in (".pstats", ".collapsed"):
+            path = out_prefix.with_name(out_prefix.name + suffix)
+            if path.exists():
+                print("Wrote", path.relative_to(root))
+        print()
 
 
 # -------------------------------------------------------------------
@@ -212,27 +948,136 @@ def update_readme_with_measurements(
 # -------------------------------------------------------------------
 # Main
 # -------------------------------------------------------------------
-def main() -> None:
+def sampling_plan(args: argparse.Namespace) -> SamplingPlan:
+    """Build the sampling plan from the defaults and command line overrides."""
+    if args.scale is not None:
+        plan = SCALE_SAMPLING
+    elif args.in_process:
+        plan = IN_PROCESS_SAMPLING
+    else:
+        plan = SAMPLING
+    if args.repeats is not None:
+        plan = plan._replace(min_repeats=args.repeats, max_repeats=args.repeats)
+    if args.warmup is not None:
+        plan = plan._replace(warmup=args.warmup)
+    if args.min_repeats is not None:
+        plan = plan._replace(min_repeats=args.min_repeats)
+    if args.max_repeats is not None:
+        plan = plan._replace(max_repeats=args.max_repeats)
+    if args.ci_width is not None:
+        plan = plan._replace(ci_width=args.ci_width)
+    return plan
+
+
+def compare(root: pathlib.Path, ref: str) -> int:
+    """
+    Print the latest measurements and complexity fits against those taken at ref.
+
+    Returns 1 on regressions or changed exponents.
+    """
+    status = 0
+
+    rows = history.compare(root, ref)
+    if rows:
+        df = pd.DataFrame(rows).set_index(["mode", "day", "interpreter"])
+        with pd.option_context("display.max_columns", None, "display.width", None):
+            print(df)
+
+        regressed = df[df["time_regression"] | df["memory_regression"]]
+        if regressed.empty:
+            print(f"\nNo regressions against {ref}.")
+        else:
+            print(f"\nRegressions against {ref}:")
+            for (mode, day, interpreter), row in regressed.iterrows():
+                kinds = [kind for kind in ("time", "memory") if row[f"{kind}_regression"]]
+                print(f"- Day {day:02d} {interpreter} ({mode}): {' and '.join(kinds)} regressed (time x{row['time_ratio']:.2f})")
+            status = 1
+    else:
+        print(f"No measurements to compare against {ref}.")
+
+    fit_rows = history.compare_fits(root, ref)
+    if fit_rows:
+        df = pd.DataFrame(fit_rows).set_index(["day", "interpreter", "measure"])
+        with pd.option_context("display.max_rows", None, "display.max_columns", None, "display.width", None):
+            print()
+            print(df)
+
+        changed = df[df["exponent_changed"]]
+        if changed.empty:
+            print(f"\nNo complexity changes against {ref}.")
+        else:
+            print(f"\nComplexity changes against {ref}:")
+            for (day, interpreter, measure), row in changed.iterrows():
+                print(
+                    f"- Day {day:02d} {interpreter} {measure}: "
+                    f"n^{row['old_exponent']:.2f} -> n^{row['new_exponent']:.2f} ({row['old_model']} -> {row['new_model']})"
+                )
+            status = 1
+
+    return status
+
+
+def main(args: argparse.Namespace) -> None:
     root = pathlib.Path(".").resolve()
 
+    if args.command == "compare":
+        sys.exit(compare(root, args.ref))
+
+    if args.profile is not None:
+        profile_day(root, args.profile, interpreters, args.profiler, args.top)
+        return
+
+    if args.scale is not None:
+        df = collect_scale_measurements(
+            root, interpreters, args.scale, args.sizes, sampling_plan(args), args.seed, args.jobs, args.reserve_cores
+        )
+        fits = fit_complexity(df, interpreters)
+        history.append_records(root, make_fit_records(root, fits, interpreters, args.seed))
+
+        with pd.option_context("display.max_rows", None, "display.max_columns", None, "display.width", None):
+            print(df)
+            print()
+            if fits.empty:
+                print(f"No fits: every column has fewer than {complexity.MIN_POINTS} sizes")
+            else:
+                print(fits)
+        df.to_csv(root / SCALE_DIR / "results.csv")
+        if not fits.empty:
+            fits.to_csv(root / SCALE_DIR / "complexity.csv")
+        return
+
     # 1. Show interpreter versions
     print_interpreter_versions(interpreters)
 
     # 2. Collect measurements
-    df = collect_measurements(root, interpreters, REPEATS)
+    plan = sampling_plan(args)
+    if args.in_process:
+        collect = functools.partial(collect_in_process_measurements, concurrent_parts=args.concurrent_parts)
+    else:
+        collect = collect_measurements
+    df, records = collect(root, interpreters, plan, args.force, args.jobs, args.reserve_cores)
+
+    history.append_records(root, records)
+
+    if args.memory:
+        memory_df = collect_memory_measurements(root, interpreters, args.jobs, args.reserve_cores, args.top)
+        df = df.join(memory_df, how="outer")
 
     # 3. Print DataFrame to stdout
     if df.empty:
         print("No measurement results produced.")
         return
 
-    print(df)
+    with pd.option_context("display.max_columns", None, "display.width", None):
+        print(df)
 
     # 4. Build markdown
     md = get_interpreter_markdown(interpreters)
 
+    df = df[[col for col in df.columns if not col.endswith(DETAIL_COLUMNS)]]
+
     def get_floatfmt(col: str) -> str:
-        if "Time" in col:
+        if col.endswith(("[s]", "[ms]")):
             return ".03f"
         elif "Memory" in col:
             return ".01f"
@@ -250,4 +1095,64 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Measure running time and memory of each day.")
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="import each program once per interpreter and time parse/part1/part2 inside a warm process",
+    )
+    parser.add_argument(
+        "--concurrent-parts",
+        action="store_true",
+        help="with --in-process, run part1 and part2 of days that set PARTS_INDEPENDENT on two threads",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="also sample RSS and trace the allocations of each phase, with reports in .bench/memory",
+    )
+    parser.add_argument(
+        "--scale",
+        type=int,
+        nargs="*",
+        metavar="DAY",
+        help="run DAYs (default: all) on generated inputs of growing size and report time and memory against n",
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", metavar="N", help="sizes to use with --scale instead of each day's ladder")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the generated inputs for --scale")
+    parser.add_argument("--profile", type=int, metavar="DAY", help="profile DAY's main() instead of measuring")
+    parser.add_argument(
+        "--profiler",
+        choices=["cprofile", "sample"],
+        default="cprofile",
+        help="profiling backend: deterministic cProfile or a SIGPROF sampling profiler",
+    )
+    parser.add_argument("--top", type=int, default=20, help="number of hot functions or allocation sites to report")
+    parser.add_argument("--force", action="store_true", help="measure again even if a cached result exists")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="number of measurements to run in parallel, one per core")
+    parser.add_argument(
+        "--reserve-cores",
+        type=int,
+        default=0,
+        help="number of cores to keep free of measurements for the rest of the system",
+    )
+    parser.add_argument("--repeats", type=int, help="fixed number of runs per day and interpreter")
+    parser.add_argument("--warmup", type=int, help="number of discarded runs before sampling")
+    parser.add_argument("--min-repeats", type=int, help="minimum number of measured runs")
+    parser.add_argument("--max-repeats", type=int, help="maximum number of measured runs")
+    parser.add_argument(
+        "--ci-width",
+        type=float,
+        help="stop sampling once the 95%% confidence interval is narrower than this fraction of the mean",
+    )
+
+    subparsers = parser.add_subparsers(dest="command")
+    compare_parser = subparsers.add_parser(
+        "compare",
+        help="compare the latest stored measurements with those taken at a git ref",
+    )
+    compare_parser.add_argument("ref", help="git commit or ref of the baseline")
+
+    args = parser.parse_args()
+
+    main(args)
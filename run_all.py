@@ -0,0 +1,121 @@
+"""
+Solve every day in a single process and check the answers.
+
+Each day/NN/program.py is imported once, and its main() reads in.txt from an
+in-memory stdin. The printed answers are compared with out.txt, and the wall
+time and max RSS of each day and of the whole run are reported. With
+--processes, days are spread over a process pool instead.
+
+Usage: python run_all.py [--days N ...] [--processes N]
+"""
+
+import argparse
+import contextlib
+import io
+import pathlib
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from bench.worker import load_program
+
+# ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+MAXRSS_DIVISOR = 1024 if sys.platform == "darwin" else 1
+
+
+def max_rss_kb(who: int = resource.RUSAGE_SELF) -> int:
+    return resource.getrusage(who).ru_maxrss // MAXRSS_DIVISOR
+
+
+def find_days(root: pathlib.Path, days: list[int] | None) -> list[pathlib.Path]:
+    paths = sorted(p for p in (root / "day").iterdir() if p.name.isdigit() and int(p.name) > 0)
+    if days:
+        paths = [p for p in paths if int(p.name) in days]
+    return [p for p in paths if (p / "in.txt").exists()]
+
+
+def run_day(day_path: pathlib.Path) -> dict:
+    """
+    Import a day and run its main() on in.txt with stdout captured.
+
+    "rss_growth_kb" is how much the day raised this process's max RSS.
+    """
+    result = {"day": int(day_path.name), "ok": False, "import_s": 0.0, "wall_s": 0.0}
+    rss_before = max_rss_kb()
+    data = (day_path / "in.txt").read_bytes()
+    out_path = day_path / "out.txt"
+    expected = out_path.read_text().split("\n") if out_path.exists() else None
+
+    stdin = sys.stdin
+    stdout = io.StringIO()
+    try:
+        t0 = time.perf_counter()
+        module = load_program(day_path)
+        t1 = time.perf_counter()
+
+        sys.stdin = io.TextIOWrapper(io.BytesIO(data))
+        with contextlib.redirect_stdout(stdout):
+            module.main()
+        t2 = time.perf_counter()
+    except Exception as err:
+        result["error"] = f"{type(err).__name__}: {err}"
+        return result
+    finally:
+        sys.stdin = stdin
+
+    answers = [line.strip() for line in stdout.getvalue().split("\n") if line.strip()]
+    result["import_s"] = t1 - t0
+    result["wall_s"] = t2 - t1
+    result["max_rss_kb"] = max_rss_kb()
+    result["rss_growth_kb"] = result["max_rss_kb"] - rss_before
+
+    if expected is None:
+        result["ok"] = True
+    elif answers == [line.strip() for line in expected if line.strip()]:
+        result["ok"] = True
+    else:
+        result["error"] = f"wrong answers {answers}"
+    return result
+
+
+def print_report(results: list[dict], total_s: float, peak_kb: int) -> None:
+    print(f"{'Day':>3}  {'Import [s]':>10}  {'Time [s]':>10}  {'Max RSS [KB]':>12}  {'RSS Growth [KB]':>15}  Result")
+    for result in results:
+        status = "ok" if result["ok"] else result["error"]
+        print(
+            f"{result['day']:>3}  {result['import_s']:>10.3f}  {result['wall_s']:>10.3f}  "
+            f"{result.get('max_rss_kb', 0):>12}  {result.get('rss_growth_kb', 0):>15}  {status}"
+        )
+
+    solved = sum(result["ok"] for result in results)
+    busy_s = sum(result["import_s"] + result["wall_s"] for result in results)
+    print(f"\n{solved}/{len(results)} days correct")
+    print(f"Total: {total_s:.3f} s wall ({busy_s:.3f} s in days), peak RSS {peak_kb} KB")
+
+
+def main(args: argparse.Namespace) -> int:
+    root = pathlib.Path(__file__).resolve().parent
+    day_paths = find_days(root, args.days)
+
+    start = time.perf_counter()
+    if args.processes > 1:
+        with ProcessPoolExecutor(args.processes) as pool:
+            results = list(pool.map(run_day, day_paths))
+    else:
+        results = [run_day(day_path) for day_path in day_paths]
+    total_s = time.perf_counter() - start
+
+    peak_kb = max(max_rss_kb(), max_rss_kb(resource.RUSAGE_CHILDREN))
+    print_report(results, total_s, peak_kb)
+
+    return 0 if all(result["ok"] for result in results) else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Solve every day in one process and check the answers.")
+    parser.add_argument("--days", type=int, nargs="+", metavar="N", help="only run these days")
+    parser.add_argument("--processes", type=int, default=1, help="spread days over this many worker processes")
+    args = parser.parse_args()
+
+    sys.exit(main(args))